@@ -0,0 +1,98 @@
+"""Benchmark de arranque: tiempo hasta la pantalla de ingreso y hasta la primera pestaña.
+
+Cada medición corre en un proceso nuevo (imports en frío) con `streamlit.testing.AppTest`
+contra la base configurada en secrets.toml:
+
+    python bench/arranque.py                   # 5 repeticiones, con el snapshot de precompute si hay
+    python bench/arranque.py --sin-snapshot    # fuerza la carga completa desde Supabase
+    python bench/arranque.py --centro "Casa Maranatha" --usuario guillermina
+
+Muestra la mediana de cada fase y qué módulos pesados ya estaban cargados al dibujar el login.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP = os.path.join(RAIZ, "app.py")
+PESADOS = ["pandas", "numpy", "supabase", "httpx", "postgrest", "hogar.datos", "hogar.ui.sesion"]
+PESTANIAS = ["Legajos", "Bitácora", "Sin contacto", "Alta", "Reportes", "Global"]
+
+def _app(args):
+    sys.path.insert(0, RAIZ)
+    from hogar.config import leer_secrets
+    from streamlit.testing.v1 import AppTest
+    at = AppTest.from_file(APP, default_timeout=120)
+    seccion = dict(leer_secrets(args.secrets))
+    if args.sin_snapshot: seccion["snapshot"] = ""
+    at.secrets["supabase"] = seccion
+    return at
+
+def _medir(at):
+    t = time.perf_counter()
+    at.run()
+    if at.exception: raise RuntimeError(at.exception[0].value)
+    return time.perf_counter() - t
+
+def fase_login(args):
+    t = time.perf_counter()
+    at = _app(args)
+    importar = time.perf_counter() - t
+    antes = set(sys.modules)
+    render = _medir(at)
+    return {"importar streamlit": importar, "login (render)": render,
+            "_cargados": [m for m in PESADOS if m in sys.modules and m not in antes]}
+
+def fase_pestanias(args):
+    at = _app(args)
+    at.session_state["logged_in"] = True
+    at.session_state["usuario"] = args.usuario
+    at.session_state["centro_asignado"] = args.centro
+    at.session_state["nombre_visible"] = args.usuario
+    r = {"primera pestaña (Inicio)": _medir(at), "rerun Inicio": _medir(at)}
+    for p in PESTANIAS:
+        if p not in [t.label for t in at.tabs]: continue
+        at.session_state["tab_activa"] = p
+        r[f"abrir {p}"] = _medir(at)
+    return r
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--secrets", help="secrets.toml (por defecto .streamlit/secrets.toml)")
+    parser.add_argument("--sin-snapshot", action="store_true", help="ignorar el snapshot precalculado")
+    parser.add_argument("--usuario", default="admin")
+    parser.add_argument("--centro", default="Administración")
+    parser.add_argument("--repeticiones", type=int, default=5)
+    parser.add_argument("--fase", choices=["login", "pestanias"], help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.fase:
+        r = fase_login(args) if args.fase == "login" else fase_pestanias(args)
+        print(json.dumps(r))
+        return
+
+    resultados = {}
+    cargados = set()
+    for _ in range(args.repeticiones):
+        for fase in ["login", "pestanias"]:
+            cmd = [sys.executable, __file__, "--fase", fase, "--usuario", args.usuario, "--centro", args.centro]
+            if args.secrets: cmd += ["--secrets", args.secrets]
+            if args.sin_snapshot: cmd.append("--sin-snapshot")
+            salida = subprocess.run(cmd, capture_output=True, text=True, cwd=RAIZ)
+            if salida.returncode != 0:
+                sys.exit(salida.stderr.strip().splitlines()[-1] if salida.stderr.strip() else f"fase {fase} falló")
+            r = json.loads(salida.stdout.strip().splitlines()[-1])
+            cargados.update(r.pop("_cargados", []))
+            for k, v in r.items(): resultados.setdefault(k, []).append(v)
+
+    print(f"{'fase':<28}{'mediana (s)':>12}{'mín (s)':>10}")
+    for k, v in resultados.items():
+        print(f"{k:<28}{statistics.median(v):>12.3f}{min(v):>10.3f}")
+    print(f"módulos pesados importados por la pantalla de ingreso: {', '.join(sorted(cargados)) or 'ninguno'}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,258 @@
+"""Prueba de carga: cuántas sesiones simultáneas aguanta un proceso de app.py.
+
+Simula N coordinadores a la vez con `streamlit.testing.AppTest` contra un Supabase falso en
+memoria (bench/falso_supabase.py) con latencia configurable. Cada usuario entra por la
+pantalla de ingreso, recorre las pestañas, abre un legajo, guarda una nota en la bitácora,
+busca en ella y carga una planilla de asistencia. Todas las sesiones comparten el proceso,
+como en un despliegue real: comparten los almacenes de datos y el GIL.
+
+    python bench/carga.py                                  # 1, 5 y 10 usuarios con 300 personas
+    python bench/carga.py --usuarios 1,10,25 --personas 300,1500 --latencia 0.08
+    python bench/carga.py --formato compacto --detalle     # latencias por paso
+
+Cada escenario (usuarios x personas) corre en un proceso nuevo. Reporta p50/p95/p99 de la
+duración de los reruns, llamadas al backend (totales y por sesión) y memoria: la que ocupa
+el proceso con la primera sesión cargada y la que suma cada sesión adicional.
+"""
+import argparse
+import json
+import os
+import random
+import resource
+import subprocess
+import sys
+import threading
+import time
+from datetime import date, timedelta
+
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+APP = os.path.join(RAIZ, "app.py")
+
+def _rss_mb():
+    try:
+        with open("/proc/self/statm") as f:
+            return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE") / 2**20
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+def _percentil(valores, p):
+    if not valores: return float("nan")
+    v = sorted(valores)
+    return v[min(len(v) - 1, int(round(p / 100 * (len(v) - 1))))]
+
+# ======================================================
+# APPTEST CON VARIAS SESIONES EN PARALELO
+# ======================================================
+def preparar_apptest(secrets):
+    """AppTest está pensado para un test a la vez: en cada run reemplaza globales del proceso
+    (el Runtime, st.secrets y las opciones de config) y los restaura al terminar, así que con
+    varias sesiones en paralelo una le saca el Runtime a otra en medio de su rerun. Acá se fijan
+    esos globales una sola vez para todo el proceso y los runs dejan de tocarlos."""
+    import contextlib
+    from unittest.mock import MagicMock
+    import streamlit as st
+    from streamlit import config
+    from streamlit.runtime import Runtime
+    from streamlit.runtime.secrets import Secrets
+    from streamlit.testing.v1 import app_test
+    from streamlit.testing.v1.util import build_mock_config_get_option
+
+    runtime = MagicMock(spec=Runtime)
+    runtime.media_file_mgr = app_test.MediaFileManager(app_test.MemoryMediaFileStorage("/mock/media"))
+    runtime.dataframe_source_mgr = app_test.DataframeSourceManager()
+    runtime.cache_storage_manager = app_test.MemoryCacheStorageManager()
+    componentes = app_test.BidiComponentManager()
+    componentes.discover_and_register_components(start_file_watching=False)
+    runtime.bidi_component_registry = componentes
+    Runtime._instance = runtime
+    # Los runs asignan su runtime de prueba a esta subclase, sin pisar el compartido.
+    app_test.Runtime = type("RuntimeDeSesion", (Runtime,), {})
+
+    config.get_option = build_mock_config_get_option({"global.appTest": True})
+    app_test.patch_config_options = lambda opciones: contextlib.nullcontext()
+
+    compartidos = Secrets()
+    compartidos._secrets = secrets
+    st.secrets = compartidos
+
+# ======================================================
+# UNA SESIÓN SIMULADA
+# ======================================================
+class Sesion:
+    def __init__(self, usuario, args, rnd):
+        from streamlit.testing.v1 import AppTest
+        self.usuario, self.args, self.rnd = usuario, args, rnd
+        self.at = AppTest.from_file(APP, default_timeout=300)
+        self.tiempos = []   # (paso, segundos)
+        self.errores = []
+
+    def _correr(self, paso, accion=None):
+        if accion: accion()
+        t = time.perf_counter()
+        self.at.run()
+        self.tiempos.append((paso, time.perf_counter() - t))
+        self.errores += [f"{paso}: {e.value}" for e in self.at.exception] + [f"{paso}: {e.value}" for e in self.at.error]
+        if self.args.pausa: time.sleep(self.rnd.uniform(0, self.args.pausa))
+
+    def _widget(self, tipo, etiqueta):
+        return next(w for w in getattr(self.at, tipo) if w.label == etiqueta)
+
+    def _pestania(self, nombre):
+        self._correr(f"abrir {nombre}", lambda: self.at.session_state.__setitem__("tab_activa", nombre))
+
+    def ingresar(self):
+        from falso_supabase import CLAVE
+        self._correr("pantalla de ingreso")
+        def completar():
+            self._widget("text_input", "Usuario").input(self.usuario)
+            self._widget("text_input", "Contraseña").input(CLAVE)
+            self._widget("button", "Ingresar al Sistema").click()
+        self._correr("ingreso", completar)
+        if "logged_in" not in self.at.session_state: raise RuntimeError(f"{self.usuario} no pudo ingresar: {self.errores}")
+
+    def recorrido(self, vuelta):
+        self._pestania("Legajos")
+        ficha = self._widget("selectbox", "Escribi el nombre para ver la ficha:")
+        self._correr("abrir legajo", lambda: ficha.select(self.rnd.choice([o for o in ficha.options if o])))
+        def nota():
+            self._widget("text_area", "¿Qué pasó hoy?").input(f"Se charló con la familia, turno en el hospital (vuelta {vuelta})")
+            self._widget("button", "Guardar en Bitácora (Supabase)").click()
+        self._correr("guardar nota", nota)
+        self._pestania("Bitácora")
+        self._correr("buscar en bitácora", lambda: self.at.text_input(key="bitacora_consulta").input(self.rnd.choice(["hospital", "turno familia", "dni", "escu"])))
+        self._pestania("Sin contacto")
+        self._pestania("Reportes")
+        self._pestania("Inicio")
+        def marcar():
+            # Cada vuelta carga un día distinto hacia atrás para no pisar la planilla anterior.
+            self._widget("date_input", "Fecha de carga").set_value(date.today() - timedelta(days=vuelta))
+            presentes = self._widget("multiselect", "Buscador de personas")
+            for i in self.rnd.sample(presentes.options, k=min(len(presentes.options), 10)): presentes.select(i)
+        self._correr("marcar asistencia", marcar)
+        self._correr("guardar asistencia", lambda: self._widget("button", "GUARDAR ASISTENCIA (SUPABASE)").click())
+
+# ======================================================
+# UN ESCENARIO (CORRE EN SU PROPIO PROCESO)
+# ======================================================
+def verificar_almacenes(base):
+    """Compara cada almacén del proceso con el backend (solo las filas de su centro si es de un
+    coordinador), después de traer las últimas novedades. Devuelve las diferencias como errores."""
+    from hogar.ui.sesion import _ALMACENES
+    from hogar.datos import tablas_datos
+    errores = []
+    for (nominal, centro), store in list(_ALMACENES.items()):
+        store.aplicar_novedades()
+        if store.actual() is None: continue
+        for tabla, df in zip(tablas_datos(nominal), store.actual()[0]):
+            esperadas = sum(1 for f in base.tablas.get(tabla, []) if centro is None or str(f.get("centro")) == centro)
+            if len(df) != esperadas: errores.append(f"almacén {centro or 'federación'}: {tabla} tiene {len(df)} filas, Supabase {esperadas}")
+    return errores
+
+def escenario(args):
+    sys.path.insert(0, RAIZ)
+    from falso_supabase import BaseFalsa, generar_datos, instalar, usuarios_de_prueba, filas_nominales
+    base = BaseFalsa(latencia=args.latencia, jitter=args.jitter)
+    generar_datos(base, personas=args.personas, dias=args.dias, usuarios=args.usuarios, formato=args.formato)
+    instalar(base)
+    preparar_apptest({"supabase": {"url": "http://supabase.falso", "key": "falsa", "refresco": args.refresco, "snapshot": ""}})
+    rss_base = _rss_mb()
+    usuarios = usuarios_de_prueba(args.usuarios)
+
+    # La primera sesión entra sola: carga los almacenes compartidos de su centro.
+    primera = Sesion(usuarios[0][0], args, random.Random(0))
+    primera.ingresar()
+    rss_primera = _rss_mb()
+    llamadas_antes = base.total_llamadas()
+
+    sesiones = [primera] + [Sesion(u, args, random.Random(i)) for i, (u, _) in enumerate(usuarios[1:], start=1)]
+    largada = threading.Barrier(len(sesiones))
+    fallas = []
+    def correr(s):
+        try:
+            largada.wait()
+            if s is not primera: s.ingresar()
+            for vuelta in range(1, args.vueltas + 1): s.recorrido(vuelta)
+        except Exception as e:
+            fallas.append(f"{s.usuario}: {type(e).__name__}: {e}")
+    t = time.perf_counter()
+    hilos = [threading.Thread(target=correr, args=(s,)) for s in sesiones]
+    for h in hilos: h.start()
+    for h in hilos: h.join()
+    duracion = time.perf_counter() - t
+    rss_final = _rss_mb()
+
+    tiempos = [(p, s) for ses in sesiones for p, s in ses.tiempos[2 if ses is primera else 0:]]
+    por_paso = {}
+    for p, s in tiempos: por_paso.setdefault(p, []).append(s)
+    por_operacion = {}
+    for (op, _), n in base.llamadas.items(): por_operacion[op] = por_operacion.get(op, 0) + n
+    return {
+        "usuarios": args.usuarios, "personas": args.personas, "filas_nominal": filas_nominales(base),
+        "reruns": [s for _, s in tiempos], "por_paso": por_paso, "duracion": duracion,
+        "llamadas": base.total_llamadas(), "llamadas_concurrencia": base.total_llamadas() - llamadas_antes, "por_operacion": por_operacion,
+        "mb_primera": rss_primera - rss_base,
+        "mb_por_sesion": (rss_final - rss_primera) / (len(sesiones) - 1) if len(sesiones) > 1 else float("nan"),
+        "errores": [e for s in sesiones for e in s.errores] + fallas + verificar_almacenes(base),
+    }
+
+# ======================================================
+# ORQUESTADOR
+# ======================================================
+def _lista(texto):
+    return [int(x) for x in texto.split(",") if x.strip()]
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--usuarios", default="1,5,10", help="sesiones simultáneas, separadas por coma")
+    parser.add_argument("--personas", default="300", help="tamaños de padrón, separados por coma")
+    parser.add_argument("--dias", type=int, default=180, help="días de historial de asistencia")
+    parser.add_argument("--formato", choices=["filas", "compacto"], default="filas", help="formato de asistencia nominal")
+    parser.add_argument("--vueltas", type=int, default=2, help="recorridos completos por usuario")
+    parser.add_argument("--latencia", type=float, default=0.03, help="segundos por llamada al backend")
+    parser.add_argument("--jitter", type=float, default=0.02, help="latencia extra aleatoria (0 a este valor)")
+    parser.add_argument("--pausa", type=float, default=0.0, help="pausa aleatoria entre acciones (0 a este valor)")
+    parser.add_argument("--refresco", type=float, default=3.0, help="segundos entre consultas de novedades")
+    parser.add_argument("--detalle", action="store_true", help="mostrar latencias por paso")
+    parser.add_argument("--escenario", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.escenario:
+        args.usuarios, args.personas = int(args.usuarios), int(args.personas)
+        print(json.dumps(escenario(args)))
+        return
+
+    filas = []
+    for personas in _lista(args.personas):
+        for usuarios in _lista(args.usuarios):
+            cmd = [sys.executable, __file__, "--escenario", "--usuarios", str(usuarios), "--personas", str(personas)]
+            for op in ["dias", "formato", "vueltas", "latencia", "jitter", "pausa", "refresco"]:
+                cmd += [f"--{op}", str(getattr(args, op))]
+            salida = subprocess.run(cmd, capture_output=True, text=True, cwd=RAIZ)
+            if salida.returncode != 0:
+                sys.exit(salida.stderr.strip().splitlines()[-1] if salida.stderr.strip() else f"escenario {usuarios}x{personas} falló")
+            r = json.loads(salida.stdout.strip().splitlines()[-1])
+            filas.append(r)
+            print(f"{usuarios} usuarios, {personas} personas: {len(r['reruns'])} reruns en {r['duracion']:.1f} s", file=sys.stderr)
+
+    print(f"{'usuarios':>8}{'personas':>9}{'filas nom.':>11}{'reruns':>7}{'p50 ms':>8}{'p95 ms':>8}{'p99 ms':>8}"
+          f"{'llamadas':>9}{'x sesión':>9}{'MB 1ra':>8}{'MB/ses.':>8}{'errores':>8}")
+    for r in filas:
+        ms = [s * 1000 for s in r["reruns"]]
+        print(f"{r['usuarios']:>8}{r['personas']:>9}{r['filas_nominal']:>11}{len(ms):>7}"
+              f"{_percentil(ms, 50):>8.0f}{_percentil(ms, 95):>8.0f}{_percentil(ms, 99):>8.0f}"
+              f"{r['llamadas']:>9}{r['llamadas_concurrencia'] / r['usuarios']:>9.1f}"
+              f"{r['mb_primera']:>8.1f}{r['mb_por_sesion']:>8.1f}{len(r['errores']):>8}")
+    if args.detalle:
+        for r in filas:
+            print(f"\n{r['usuarios']} usuarios, {r['personas']} personas — llamadas por operación: "
+                  + ", ".join(f"{op} {n}" for op, n in sorted(r["por_operacion"].items())))
+            print(f"{'paso':<24}{'n':>5}{'p50 ms':>8}{'p95 ms':>8}{'p99 ms':>8}")
+            for paso, v in r["por_paso"].items():
+                ms = [s * 1000 for s in v]
+                print(f"{paso:<24}{len(ms):>5}{_percentil(ms, 50):>8.0f}{_percentil(ms, 95):>8.0f}{_percentil(ms, 99):>8.0f}")
+    errores = [e for r in filas for e in r["errores"]]
+    if errores:
+        print(f"\n{len(errores)} errores; los primeros:", *errores[:5], sep="\n  ")
+
+if __name__ == "__main__":
+    main()
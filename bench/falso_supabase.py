@@ -0,0 +1,179 @@
+"""Backend de Supabase en memoria para los benchmarks: mismas llamadas que usa la app
+(`table().select().eq()...execute()`), con latencia configurable y conteo de llamadas.
+
+    base = BaseFalsa(latencia=0.05)
+    generar_datos(base, personas=300, dias=180)
+    instalar(base)   # crear_cliente() devuelve esta base en lugar de conectarse
+
+Las filas se guardan como dicts y cada lectura devuelve copias, como si vinieran de JSON.
+Como PostgREST, ninguna lectura devuelve más de `max_filas` filas (1000 por defecto).
+"""
+import random
+import threading
+import time
+import itertools
+from collections import Counter
+from datetime import datetime, timedelta, timezone
+
+CENTROS = ["Calle Belén", "Nudo a Nudo", "Casa Maranatha"]
+CATEGORIAS = ["Escucha / Acompañamiento", "Salud", "Trámite (DNI/Social)", "Educación", "Familiar", "Crisis / Conflicto", "Otro"]
+PALABRAS = ("se charló con la familia turno en el hospital control médico escuela inscripción "
+            "trámite del dni acompañamiento a la guardia beca changa comida abrigo vacunas "
+            "pelea en el barrio crisis escucha referente madre padre hermano trabajo").split()
+CLAVE = "clave"
+
+class Respuesta:
+    def __init__(self, data):
+        self.data = data
+
+class Consulta:
+    def __init__(self, base, tabla):
+        self.base, self.tabla = base, tabla
+        self.op, self.columnas, self.payload = "select", None, None
+        self.filtros, self.rango, self.orden = [], None, None
+
+    def select(self, columnas="*", **kwargs):
+        self.op = "select"
+        if columnas.strip() != "*": self.columnas = [c.strip() for c in columnas.split(",")]
+        return self
+
+    def insert(self, filas):
+        self.op, self.payload = "insert", filas if isinstance(filas, list) else [filas]
+        return self
+
+    def update(self, valores):
+        self.op, self.payload = "update", valores
+        return self
+
+    def delete(self):
+        self.op = "delete"
+        return self
+
+    def _filtro(self, f):
+        self.filtros.append(f)
+        return self
+
+    def eq(self, c, v): return self._filtro(lambda r: str(r.get(c)) == str(v))
+    def gt(self, c, v): return self._filtro(lambda r: r.get(c) is not None and str(r.get(c)) > str(v))
+    def gte(self, c, v): return self._filtro(lambda r: r.get(c) is not None and str(r.get(c)) >= str(v))
+    def lte(self, c, v): return self._filtro(lambda r: r.get(c) is not None and str(r.get(c)) <= str(v))
+    def in_(self, c, vs): return self._filtro(lambda r, vs=set(vs): r.get(c) in vs)
+    def is_(self, c, v): return self._filtro(lambda r: r.get(c) is None)
+    def ilike(self, c, v): return self._filtro(lambda r: str(r.get(c)).lower() == str(v).lower())
+    def limit(self, *args, **kwargs): return self
+
+    def order(self, columna, desc=False, **kwargs):
+        self.orden = (columna, desc)
+        return self
+
+    def range(self, desde, hasta):
+        self.rango = (desde, hasta)
+        return self
+
+    def execute(self):
+        return self.base.ejecutar(self)
+
+class BaseFalsa:
+    """Tablas en memoria compartidas por todas las sesiones del proceso."""
+
+    def __init__(self, latencia=0.0, jitter=0.0, max_filas=1000):
+        self.latencia, self.jitter, self.max_filas = latencia, jitter, max_filas
+        self.tablas = {}
+        self.llamadas = Counter()   # (operación, tabla) -> cantidad
+        self._lock = threading.Lock()
+        self._ids = itertools.count(1)
+
+    def table(self, tabla):
+        return Consulta(self, tabla)
+
+    def nuevo_id(self):
+        return next(self._ids)
+
+    def ejecutar(self, q):
+        if self.latencia or self.jitter: time.sleep(self.latencia + random.uniform(0, self.jitter))
+        with self._lock:
+            self.llamadas[(q.op, q.tabla)] += 1
+            filas = self.tablas.setdefault(q.tabla, [])
+            if q.op == "insert":
+                ahora = datetime.now(timezone.utc).isoformat()
+                nuevas = [dict({"id": self.nuevo_id(), "created_at": ahora}, **f) for f in q.payload]
+                filas.extend(nuevas)
+                return Respuesta([dict(f) for f in nuevas])
+            elegidas = [f for f in filas if all(filtro(f) for filtro in q.filtros)]
+            if q.op == "update":
+                for f in elegidas: f.update(q.payload)
+            elif q.op == "delete":
+                ids = {id(f) for f in elegidas}
+                self.tablas[q.tabla] = [f for f in filas if id(f) not in ids]
+            if q.op != "select": return Respuesta([dict(f) for f in elegidas])
+            if q.orden:
+                columna, desc = q.orden
+                elegidas = sorted(elegidas, key=lambda f: (f.get(columna) is None, f.get(columna)), reverse=desc)
+            if q.rango: elegidas = elegidas[q.rango[0]:q.rango[1] + 1]
+            if self.max_filas: elegidas = elegidas[:self.max_filas]
+            if q.columnas: return Respuesta([{c: f.get(c) for c in q.columnas} for f in elegidas])
+            return Respuesta([dict(f) for f in elegidas])
+
+    def total_llamadas(self):
+        return sum(self.llamadas.values())
+
+def instalar(base):
+    """Hace que `hogar.conexion.crear_cliente` use `base` en vez de crear un cliente real."""
+    import hogar.conexion
+    hogar.conexion.create_client = lambda url, key, options=None: base
+
+def usuarios_de_prueba(n):
+    """Nombres de usuario de las sesiones simuladas, repartidos entre los centros."""
+    return [(f"coord{i}", CENTROS[i % len(CENTROS)]) for i in range(n)]
+
+def generar_datos(base, personas=300, dias=180, notas_por_persona=3, usuarios=10, formato="filas", semilla=1):
+    """Llena `base` con un padrón repartido entre los centros, una planilla diaria por centro
+    durante `dias` días (en el formato de asistencia elegido) y notas de bitácora."""
+    rnd = random.Random(semilla)
+    hoy = datetime.now(timezone.utc).date()
+    t = base.tablas
+    t["usuarios"] = [{"usuario": u, "password_text": CLAVE, "centro": c, "nombre_visible": u.capitalize()} for u, c in usuarios_de_prueba(usuarios)]
+    t["usuarios"].append({"usuario": "admin", "password_text": CLAVE, "centro": "Administración", "nombre_visible": "Admin"})
+    t["personas"] = [{
+        "id": base.nuevo_id(), "nombre": f"Persona {i:05d}", "centro": CENTROS[i % len(CENTROS)], "activo": "SI",
+        "dni": str(20000000 + i), "fecha_nacimiento": f"{1960 + i % 45}-{1 + i % 12:02d}-{1 + i % 28:02d}",
+        "telefono": "2914000000", "domicilio": None, "notas": None, "contacto_emergencia": None, "etiquetas": None,
+        "created_at": "2024-01-01T00:00:00+00:00",
+    } for i in range(personas)]
+    por_centro = {c: [p for p in t["personas"] if p["centro"] == c] for c in CENTROS}
+
+    t["asistencia_diaria"], t["asistencia_personas"], t["planillas_asistencia"], t["padrones"] = [], [], [], []
+    padron_de = {}
+    for d in range(dias, 0, -1):
+        fecha = (hoy - timedelta(days=d)).isoformat()
+        creada = f"{fecha}T20:00:00+00:00"
+        for c in CENTROS:
+            gente = por_centro[c]
+            presentes = [p for p in gente if rnd.random() < 0.4]
+            comun = {"fecha": fecha, "anio": fecha[:4], "centro": c, "espacio": "General", "coordinador": "Coord", "usuario": "coord", "created_at": creada}
+            t["asistencia_diaria"].append(dict(comun, id=base.nuevo_id(), presentes=len(presentes), modo="Día habitual", notas="", accion="append"))
+            if formato == "compacto":
+                if c not in padron_de:
+                    padron_de[c] = base.nuevo_id()
+                    t["padrones"].append({"id": padron_de[c], "centro": c, "personas": sorted(p["id"] for p in gente)})
+                t["planillas_asistencia"].append(dict(comun, id=base.nuevo_id(), presentes=sorted(p["id"] for p in presentes), padron_id=padron_de[c]))
+            else:
+                ids_presentes = {p["id"] for p in presentes}
+                t["asistencia_personas"].extend(dict(
+                    comun, id=base.nuevo_id(), persona_id=p["id"], nombre=p["nombre"], es_nuevo="NO",
+                    estado="Presente" if p["id"] in ids_presentes else "Ausente",
+                ) for p in gente)
+
+    t["bitacora_seguimiento"] = []
+    for p in t["personas"]:
+        for _ in range(notas_por_persona):
+            fecha = (hoy - timedelta(days=rnd.randint(1, max(dias, 1)))).isoformat()
+            t["bitacora_seguimiento"].append({
+                "id": base.nuevo_id(), "created_at": f"{fecha}T21:00:00+00:00", "fecha": fecha, "anio": fecha[:4],
+                "centro": p["centro"], "persona_id": p["id"], "nombre_persona": p["nombre"], "categoria": rnd.choice(CATEGORIAS),
+                "observacion": " ".join(rnd.choices(PALABRAS, k=rnd.randint(6, 30))), "usuario_registro": "coord",
+            })
+    return base
+
+def filas_nominales(base):
+    return len(base.tablas.get("asistencia_personas", [])) + len(base.tablas.get("planillas_asistencia", []))
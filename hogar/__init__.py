@@ -0,0 +1,4 @@
+"""Capa de datos y cálculos de la app del Hogar de Cristo Bahía Blanca, sin Streamlit.
+
+La usan `app.py` y la línea de comandos (`python -m hogar --help`).
+"""
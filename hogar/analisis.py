@@ -0,0 +1,331 @@
+import pandas as pd
+import numpy as np
+from datetime import date, timedelta
+
+from .helpers import get_today_ar, CENTROS, CALENDARIO_CENTROS, CATEGORIAS_SEGUIMIENTO
+from .datos import presencias_nominales, asistencia_nominal
+from .busqueda import reconstruir_busqueda, aplicar_busqueda
+
+# ======================================================
+# FRECUENCIA DE ASISTENCIA POR PERSONA (ÍNDICE INCREMENTAL)
+# ======================================================
+# Cada persona se guarda como (centro, origen, mascara): `origen` es el ordinal de su primer
+# día presente y el bit i de `mascara` indica si estuvo presente el día origen + i. Es unos
+# 46 bytes por persona y por año, y alcanza para sacar primera/última asistencia y cualquier
+# ventana de días sin volver a recorrer asistencia_personas.
+FRECUENCIA_UMBRAL_DIARIA = 12   # días presentes en los últimos 28 (3 o más por semana)
+FRECUENCIA_UMBRAL_SEMANAL = 3   # días presentes en los últimos 28
+FRECUENCIA_VENTANA_MENSUAL = 60 # con al menos un día presente en esta ventana es "Mensual"
+RETENCION_EN_RIESGO = 30        # días sin venir para pasar a "En riesgo"
+RETENCION_PERDIDO = 60          # días sin venir para pasar a "Perdido"
+
+def ordinales_fecha(fechas):
+    """Fechas ISO -> ordinal de `date` (NaN si no se puede leer), sin recorrer fila por fila."""
+    return (pd.to_datetime(fechas, errors="coerce") - pd.Timestamp("1970-01-01")).dt.days + date(1970, 1, 1).toordinal()
+
+def _dias_presentes(df_ap):
+    """persona_id -> (centro, set de ordinales) con los días en que figura como Presente."""
+    pres = presencias_nominales(df_ap)
+    if pres.empty: return {}
+    pres = pres.assign(persona_id=pres["persona_id"].astype("int64"), ord=ordinales_fecha(pres["fecha"])).dropna(subset=["ord"])
+    pres = pres.drop_duplicates(["persona_id", "ord"])
+    centros = pres.drop_duplicates("persona_id", keep="last").set_index("persona_id")["centro"]
+    return {int(p): (centros[p], set(int(o) for o in g)) for p, g in pres.groupby("persona_id")["ord"]}
+
+def _fusionar_dias(registro, centro, ordinales):
+    if registro is None:
+        origen, mascara = min(ordinales), 0
+    else:
+        _, origen, mascara = registro
+        nuevo_origen = min(origen, min(ordinales))
+        mascara <<= origen - nuevo_origen
+        origen = nuevo_origen
+    for o in ordinales: mascara |= 1 << (o - origen)
+    return (centro, origen, mascara)
+
+def reconstruir_frecuencias(datos):
+    return {pid: _fusionar_dias(None, c, dias) for pid, (c, dias) in _dias_presentes(datos[2]).items()}
+
+def aplicar_frecuencias(anterior, datos, deltas):
+    nuevos = _dias_presentes(deltas[2])
+    if not nuevos: return anterior
+    resumen = dict(anterior)
+    for pid, (c, dias) in nuevos.items():
+        resumen[pid] = _fusionar_dias(resumen.get(pid), c, dias)
+    return resumen
+
+def _dias_en_ventana(origen, mascara, desde_ord):
+    if desde_ord <= origen: return mascara.bit_count()
+    return (mascara >> (desde_ord - origen)).bit_count()
+
+def clasificar_frecuencias(resumen, hoy):
+    """Tabla por persona con frecuencia, primera/última asistencia y cohorte de retención al día
+    `hoy`: los días posteriores no cuentan y quien empezó a venir después no aparece."""
+    cols = ["persona_id", "centro", "primera_asistencia", "ultima_asistencia", "dias_totales", "dias_28", "frecuencia", "cohorte", "retencion"]
+    if not resumen: return pd.DataFrame(columns=cols)
+    hoy_ord = hoy.toordinal()
+    filas = []
+    for pid, (c, origen, mascara) in resumen.items():
+        if origen > hoy_ord: continue
+        mascara &= (1 << (hoy_ord - origen + 1)) - 1
+        ultima = origen + mascara.bit_length() - 1
+        d28 = _dias_en_ventana(origen, mascara, hoy_ord - 27)
+        sin_venir = hoy_ord - ultima
+        if d28 >= FRECUENCIA_UMBRAL_DIARIA: frecuencia = "Diaria"
+        elif d28 >= FRECUENCIA_UMBRAL_SEMANAL: frecuencia = "Semanal"
+        elif sin_venir < FRECUENCIA_VENTANA_MENSUAL: frecuencia = "Mensual"
+        else: frecuencia = "No asiste"
+        if hoy_ord - origen < RETENCION_EN_RIESGO: retencion = "Nuevo"
+        elif sin_venir < RETENCION_EN_RIESGO: retencion = "Activo"
+        elif sin_venir < RETENCION_PERDIDO: retencion = "En riesgo"
+        else: retencion = "Perdido"
+        primera = date.fromordinal(origen)
+        filas.append((pid, c, primera.isoformat(), date.fromordinal(ultima).isoformat(), mascara.bit_count(), d28, frecuencia, primera.strftime("%Y-%m"), retencion))
+    return pd.DataFrame(filas, columns=cols)
+
+def frecuencias_padron(df_personas, resumen, hoy):
+    """Cruza el padrón con el resumen: quien nunca figuró presente queda como "No asiste"."""
+    clas = clasificar_frecuencias(resumen, hoy).drop(columns="centro")
+    if df_personas.empty: return clas
+    df = df_personas[["id", "nombre"]].drop_duplicates("id").rename(columns={"id": "persona_id"}).merge(clas, on="persona_id", how="left")
+    df["frecuencia"] = df["frecuencia"].fillna("No asiste")
+    df["dias_totales"] = df["dias_totales"].fillna(0).astype(int)
+    df["dias_28"] = df["dias_28"].fillna(0).astype(int)
+    return df
+
+# ======================================================
+# ÚLTIMO CONTACTO POR PERSONA (ÍNDICE INCREMENTAL)
+# ======================================================
+# persona_id -> (última asistencia, última intervención, {categoría: intervenciones}), con las
+# fechas como ordinales (None si nunca). Asistencia nominal y bitácora se cruzan una sola vez
+# en la carga completa; después cada planilla o nota nueva solo toca a sus personas.
+SIN_CONTACTO_DIAS = RETENCION_EN_RIESGO  # umbral por defecto de la vista "sin contacto"
+
+def _ultimas_presencias(df_ap):
+    pres = presencias_nominales(df_ap)
+    if pres.empty: return {}
+    pres = pres.assign(persona_id=pres["persona_id"].astype("int64"), ord=ordinales_fecha(pres["fecha"])).dropna(subset=["ord"])
+    return {int(p): int(o) for p, o in pres.groupby("persona_id")["ord"].max().items()}
+
+def _intervenciones(df_seg):
+    """persona_id -> [ordinal de la última nota, {categoría: cantidad}] de las notas con persona_id."""
+    if df_seg.empty or "persona_id" not in df_seg.columns: return {}
+    d = df_seg.dropna(subset=["persona_id"])
+    if d.empty: return {}
+    d = d.assign(persona_id=d["persona_id"].astype("int64"), categoria=d["categoria"].fillna("Otro").astype(str), ord=ordinales_fecha(d["fecha"]))
+    res = {}
+    for (pid, cat), n in d.groupby(["persona_id", "categoria"]).size().items():
+        res.setdefault(int(pid), [None, {}])[1][cat] = int(n)
+    for pid, o in d.dropna(subset=["ord"]).groupby("persona_id")["ord"].max().items():
+        res[int(pid)][0] = int(o)
+    return res
+
+def _mas_reciente(a, b):
+    return b if a is None else a if b is None else max(a, b)
+
+def _fusionar_contacto(registro, asistencia=None, intervencion=None, categorias=None):
+    ult_asistencia, ult_intervencion, por_categoria = registro or (None, None, {})
+    if categorias:
+        por_categoria = dict(por_categoria)
+        for c, n in categorias.items(): por_categoria[c] = por_categoria.get(c, 0) + n
+    return (_mas_reciente(ult_asistencia, asistencia), _mas_reciente(ult_intervencion, intervencion), por_categoria)
+
+def _acumular_contactos(resumen, df_ap, df_seg):
+    for pid, o in _ultimas_presencias(df_ap).items():
+        resumen[pid] = _fusionar_contacto(resumen.get(pid), asistencia=o)
+    for pid, (o, cats) in _intervenciones(df_seg).items():
+        resumen[pid] = _fusionar_contacto(resumen.get(pid), intervencion=o, categorias=cats)
+    return resumen
+
+def reconstruir_contactos(datos):
+    return _acumular_contactos({}, datos[2], datos[3])
+
+def aplicar_contactos(anterior, datos, deltas):
+    if deltas[2].empty and deltas[3].empty: return anterior
+    return _acumular_contactos(dict(anterior), deltas[2], deltas[3])
+
+def tabla_contactos(df_personas, resumen, hoy):
+    """Una fila por persona del padrón con su último contacto (vino o tiene una nota en la
+    bitácora), los días que pasaron desde entonces y las intervenciones por categoría.
+    `dias_sin_contacto` queda vacío para quien nunca vino ni tiene notas."""
+    extra = sorted({c for _, _, pc in resumen.values() for c in pc} - set(CATEGORIAS_SEGUIMIENTO))
+    categorias = list(CATEGORIAS_SEGUIMIENTO) + extra
+    cols = ["persona_id", "nombre", "centro", "activo", "ultima_asistencia", "ultima_intervencion", "ultimo_contacto", "dias_sin_contacto", "intervenciones"] + categorias
+    if df_personas.empty: return pd.DataFrame(columns=cols)
+    iso = lambda o: None if o is None else date.fromordinal(o).isoformat()
+    hoy_ord = hoy.toordinal()
+    filas = []
+    for pid, nombre, centro, activo in df_personas[["id", "nombre", "centro", "activo"]].drop_duplicates("id").itertuples(index=False):
+        asistencia, intervencion, por_categoria = resumen.get(int(pid), (None, None, {}))
+        ultimo = _mas_reciente(asistencia, intervencion)
+        filas.append((
+            int(pid), nombre, centro, activo, iso(asistencia), iso(intervencion), iso(ultimo),
+            None if ultimo is None else hoy_ord - ultimo, sum(por_categoria.values()), *[por_categoria.get(c, 0) for c in categorias],
+        ))
+    df = pd.DataFrame(filas, columns=cols)
+    df["dias_sin_contacto"] = df["dias_sin_contacto"].astype("Int64")
+    return df
+
+# ======================================================
+# SERIE DIARIA DE INGRESOS POR CENTRO Y ESPACIO (SUMAS PREFIJAS)
+# ======================================================
+class SerieDiaria:
+    """Ingresos diarios densos por (centro, espacio) con sumas prefijas.
+
+    Se arma una vez por versión de datos. Cualquier total entre dos fechas sale de restar
+    dos posiciones del acumulado, sin filtrar asistencia_diaria.
+    """
+
+    def __init__(self, df_asistencia):
+        self.claves = []
+        self.inicio = get_today_ar().toordinal()
+        self.n_dias = 1
+        self.acumulado = np.zeros((0, 2), dtype=np.int64)
+        if df_asistencia.empty: return
+        df = pd.DataFrame({
+            "centro": df_asistencia["centro"].astype(str), "espacio": df_asistencia["espacio"].astype(str),
+            "ord": ordinales_fecha(df_asistencia["fecha"]),
+            "presentes": pd.to_numeric(df_asistencia["presentes"], errors="coerce").fillna(0).astype(np.int64),
+        }).dropna(subset=["ord"])
+        if df.empty: return
+        df["ord"] = df["ord"].astype(np.int64)
+        self.inicio = int(df["ord"].min())
+        self.n_dias = max(int(df["ord"].max()), get_today_ar().toordinal()) - self.inicio + 1
+        por_dia = df.groupby(["centro", "espacio", "ord"])["presentes"].sum()
+        self.claves = sorted(set(zip(por_dia.index.get_level_values(0), por_dia.index.get_level_values(1))))
+        fila = {k: i for i, k in enumerate(self.claves)}
+        diario = np.zeros((len(self.claves), self.n_dias), dtype=np.int64)
+        filas = [fila[(c, e)] for c, e in zip(por_dia.index.get_level_values(0), por_dia.index.get_level_values(1))]
+        diario[filas, por_dia.index.get_level_values(2).to_numpy() - self.inicio] = por_dia.to_numpy()
+        self.acumulado = np.concatenate([np.zeros((len(self.claves), 1), dtype=np.int64), diario.cumsum(axis=1)], axis=1)
+
+    def _filas(self, centro=None, espacio=None):
+        return [i for i, (c, e) in enumerate(self.claves) if (centro is None or c == centro) and (espacio is None or e == espacio)]
+
+    def _acumulado(self, centro=None, espacio=None):
+        filas = self._filas(centro, espacio)
+        if not filas: return np.zeros(self.n_dias + 1, dtype=np.int64)
+        return self.acumulado[filas].sum(axis=0)
+
+    def _pos(self, d):
+        return min(max(d.toordinal() - self.inicio, 0), self.n_dias)
+
+    def total(self, desde, hasta, centro=None, espacio=None):
+        """Ingresos entre `desde` y `hasta` inclusive. `centro=None` suma todos los centros."""
+        if hasta < desde: return 0
+        filas = self._filas(centro, espacio)
+        if not filas: return 0
+        a, b = self._pos(desde), self._pos(hasta + timedelta(days=1))
+        return int((self.acumulado[filas, b] - self.acumulado[filas, a]).sum())
+
+    def serie(self, desde, hasta, centro=None, espacio=None, ventanas=()):
+        """Ingresos día por día y, para cada ventana, el promedio móvil de los últimos N días."""
+        acum = self._acumulado(centro, espacio)
+        fechas = pd.date_range(desde, hasta, freq="D")
+        ords = np.arange(desde.toordinal(), hasta.toordinal() + 1) - self.inicio
+        fin = np.clip(ords + 1, 0, self.n_dias)
+        df = pd.DataFrame({"ingresos": acum[fin] - acum[np.clip(ords, 0, self.n_dias)]}, index=fechas)
+        for v in ventanas:
+            df[f"media_{v}d"] = (acum[fin] - acum[np.clip(ords + 1 - v, 0, self.n_dias)]) / v
+        return df
+
+def reconstruir_serie_diaria(datos):
+    return SerieDiaria(datos[0])
+
+INDICES_DERIVADOS = {
+    "frecuencias": (reconstruir_frecuencias, aplicar_frecuencias),
+    "serie_diaria": (reconstruir_serie_diaria, None),
+    "busqueda_bitacora": (reconstruir_busqueda, aplicar_busqueda),
+    "contactos": (reconstruir_contactos, aplicar_contactos),
+}
+
+# ======================================================
+# COBERTURA DE ACTIVIDADES (CALENDARIO VS PLANILLAS)
+# ======================================================
+def actividades_esperadas(desde, hasta, centros=CENTROS):
+    """Una fila por (fecha, centro, espacio) que el calendario espera entre `desde` y `hasta` inclusive."""
+    cal = pd.DataFrame(
+        [(c, dia, esp) for c in centros for dia, esps in CALENDARIO_CENTROS.get(c, {}).items() for esp in esps],
+        columns=["centro", "dia_semana", "espacio"],
+    )
+    fechas = pd.DataFrame({"fecha_dt": pd.date_range(desde, hasta, freq="D")})
+    fechas["dia_semana"] = fechas["fecha_dt"].dt.weekday
+    esperadas = fechas.merge(cal, on="dia_semana")
+    esperadas["fecha"] = esperadas["fecha_dt"].dt.strftime("%Y-%m-%d")
+    return esperadas[["fecha", "centro", "espacio"]]
+
+def cobertura_actividades(df_asistencia, desde, hasta, centros=CENTROS):
+    """Cruza el calendario esperado con las planillas cargadas en el rango.
+
+    Devuelve una fila por actividad esperada con `cargado` (bool) y el `coordinador`
+    de la última planilla, si existe. Las planillas de espacios fuera del calendario
+    no cuentan.
+    """
+    esperadas = actividades_esperadas(desde, hasta, centros)
+    if df_asistencia.empty:
+        esperadas["cargado"] = False
+        esperadas["coordinador"] = None
+        return esperadas
+    desde_str, hasta_str = desde.isoformat(), hasta.isoformat()
+    fechas = df_asistencia["fecha"].astype(str)
+    cargadas = df_asistencia.loc[(fechas >= desde_str) & (fechas <= hasta_str) & df_asistencia["centro"].isin(centros), ["fecha", "centro", "espacio", "coordinador", "created_at"]]
+    cargadas = cargadas.assign(fecha=cargadas["fecha"].astype(str)).sort_values("created_at").drop_duplicates(["fecha", "centro", "espacio"], keep="last")
+    cob = esperadas.merge(cargadas[["fecha", "centro", "espacio", "coordinador"]], on=["fecha", "centro", "espacio"], how="left", indicator=True)
+    cob["cargado"] = cob.pop("_merge") == "both"
+    return cob
+
+def matriz_cobertura(cob):
+    """Pivot día x (centro · espacio): True cargado, False falta, vacío si no corresponde ese día."""
+    if cob.empty: return pd.DataFrame()
+    m = cob.assign(actividad=cob["centro"] + " · " + cob["espacio"]).pivot(index="fecha", columns="actividad", values="cargado")
+    return m.sort_index(ascending=False)
+
+def resumen_cobertura_diaria(cob):
+    if cob.empty: return pd.DataFrame(columns=["fecha", "centro", "esperadas", "cargadas", "faltantes"])
+    r = cob.groupby(["fecha", "centro"])["cargado"].agg(esperadas="size", cargadas="sum").reset_index()
+    r["faltantes"] = r["esperadas"] - r["cargadas"]
+    return r.sort_values(["fecha", "centro"], ascending=[False, True])
+
+def cumplimiento_por_coordinador(cob):
+    """Tasa de carga por coordinador sobre las actividades de las que es responsable habitual.
+
+    El responsable habitual de un (centro, espacio) es quien más planillas cargó para esa
+    actividad en el rango; las faltantes de esa actividad se le imputan a esa persona.
+    """
+    hechas = cob[cob["cargado"]]
+    if hechas.empty: return pd.DataFrame(columns=["coordinador", "esperadas", "cargadas", "cumplimiento_pct"])
+    responsables = (hechas.groupby(["centro", "espacio", "coordinador"]).size().rename("n").reset_index()
+                    .sort_values("n").drop_duplicates(["centro", "espacio"], keep="last")[["centro", "espacio", "coordinador"]])
+    asignadas = cob.drop(columns="coordinador").merge(responsables, on=["centro", "espacio"], how="inner")
+    r = asignadas.groupby("coordinador")["cargado"].agg(esperadas="size", cargadas="sum").reset_index()
+    r["cumplimiento_pct"] = (100 * r["cargadas"] / r["esperadas"]).round(1)
+    return r.sort_values("cumplimiento_pct")
+
+# ======================================================
+# ALERTAS Y VISTAS EXPORTABLES
+# ======================================================
+def cumpleanos(df_personas, hoy):
+    nombres = []
+    for _, row in df_personas.iterrows():
+        try:
+            fn = pd.to_datetime(str(row.get("fecha_nacimiento")), errors="coerce")
+            if not pd.isna(fn) and fn.month == hoy.month and fn.day == hoy.day:
+                nombres.append(row["nombre"])
+        except: pass
+    return nombres
+
+def ausencias_consecutivas(df_ap, centro, ultimas=4, minimo=3):
+    """persona_id ausentes en todas las planillas de las últimas `ultimas` fechas cargadas (al menos `minimo`)."""
+    if df_ap.empty: return set()
+    ultimas_fechas = sorted(df_ap["fecha"].unique(), reverse=True)[:ultimas]
+    if len(ultimas_fechas) < minimo: return set()
+    recientes = asistencia_nominal(df_ap, fechas=ultimas_fechas)
+    if not ((recientes["centro"] == centro) & (recientes["estado"] == "Ausente")).any(): return set()
+    por_persona = recientes.assign(ausente=recientes["estado"] == "Ausente").groupby("persona_id")["ausente"].agg(["size", "all"])
+    return set(por_persona.index[(por_persona["size"] >= minimo) & por_persona["all"]])
+
+def tabla_auditoria(df_asistencia):
+    """Planillas de asistencia_diaria, de la más nueva a la más vieja, con los encabezados de la exportación histórica."""
+    return df_asistencia.sort_values("created_at", ascending=False)[["fecha", "centro", "espacio", "presentes", "coordinador", "modo", "accion"]].rename(
+        columns={"fecha": "Fecha", "centro": "Centro Barrial", "espacio": "Espacio", "presentes": "Asistentes", "coordinador": "Responsable", "modo": "Estado del Día", "accion": "Tipo Registro"}
+    )
@@ -0,0 +1,154 @@
+import re
+import math
+from array import array
+from bisect import bisect_left
+from collections import Counter
+from datetime import date
+
+import numpy as np
+
+from .helpers import clean_string
+
+# ======================================================
+# BÚSQUEDA DE TEXTO EN LA BITÁCORA (ÍNDICE INVERTIDO LOCAL)
+# ======================================================
+# Cada nota de bitacora_seguimiento es un documento, identificado por su posición en la
+# tabla del snapshot (el feed de cambios solo agrega filas al final, así que las posiciones
+# no se mueven entre recargas completas). Los términos se normalizan con las reglas de
+# clean_string: sin tildes y en mayúsculas ("acompañé" == "ACOMPANE").
+STOPWORDS = set(clean_string(
+    "a al ante con de del desde el en entre es fue ha la las le les lo los me mi no nos o para "
+    "pero por que se sin su sus te un una uno y ya"
+).split())
+K1, B = 1.2, 0.75          # parámetros de BM25
+PESO_PREFIJO = 0.8         # un término que solo coincide como prefijo pesa un poco menos
+LARGO_MINIMO_PREFIJO = 3   # "sa" no se expande a todo lo que empieza con SA
+
+def terminos(texto):
+    return [t for t in re.findall(r"[A-Z0-9]+", clean_string(texto)) if len(t) > 1 and t not in STOPWORDS]
+
+def _ordinal(fecha):
+    try: return date.fromisoformat(str(fecha)[:10]).toordinal()
+    except ValueError: return 0
+
+class IndiceBitacora:
+    """Índice invertido de `observacion` con filtros por centro, categoría, fecha y autor.
+
+    Es inmutable para quien lo lee: `con_filas()` devuelve un índice nuevo que comparte las
+    listas de los términos que no cambiaron, así las sesiones que todavía usan la versión
+    anterior no ven modificaciones a medias.
+    """
+
+    def __init__(self):
+        self.postings = {}          # término -> (docs, frecuencias), dos array('I') paralelos
+        self.largos = array("I")    # cantidad de términos de cada documento
+        self.fechas = array("i")    # ordinal de la fecha de cada nota (0 si no se puede leer)
+        self.centros = []
+        self.categorias = []
+        self.autores = []
+        self._cache = {}
+
+    def __getstate__(self):
+        return {k: v for k, v in self.__dict__.items() if k != "_cache"}
+
+    def __setstate__(self, estado):
+        self.__dict__.update(estado, _cache={})
+
+    @property
+    def n_docs(self):
+        return len(self.largos)
+
+    def con_filas(self, df_seg):
+        """Índice con las filas de `df_seg` agregadas al final, en el orden en que vienen."""
+        nuevo = IndiceBitacora()
+        nuevo.postings = dict(self.postings)
+        nuevo.largos, nuevo.fechas = array("I", self.largos), array("i", self.fechas)
+        nuevo.centros, nuevo.categorias, nuevo.autores = list(self.centros), list(self.categorias), list(self.autores)
+        if df_seg.empty: return nuevo
+        tocados = {}
+        doc = self.n_docs
+        columnas = [df_seg[c] if c in df_seg.columns else [None] * len(df_seg) for c in ["observacion", "fecha", "centro", "categoria", "usuario_registro"]]
+        for obs, fecha, centro, categoria, autor in zip(*columnas):
+            ts = terminos(obs)
+            for t, tf in Counter(ts).items(): tocados.setdefault(t, []).append((doc, tf))
+            nuevo.largos.append(len(ts))
+            nuevo.fechas.append(_ordinal(fecha))
+            nuevo.centros.append(centro)
+            nuevo.categorias.append(categoria)
+            nuevo.autores.append(autor)
+            doc += 1
+        for t, pares in tocados.items():
+            docs, tfs = self.postings.get(t, (array("I"), array("I")))
+            docs, tfs = array("I", docs), array("I", tfs)
+            docs.extend(d for d, _ in pares)
+            tfs.extend(f for _, f in pares)
+            nuevo.postings[t] = (docs, tfs)
+        return nuevo
+
+    def _arrays(self):
+        # Vistas numpy de los metadatos y el vocabulario ordenado; se arman una vez por índice.
+        if not self._cache:
+            self._cache = {
+                "largos": np.frombuffer(self.largos, dtype=np.uint32).astype(np.float64) if self.n_docs else np.zeros(0),
+                "fechas": np.frombuffer(self.fechas, dtype=np.int32) if self.n_docs else np.zeros(0, dtype=np.int32),
+                "centros": np.array(self.centros, dtype=object),
+                "categorias": np.array(self.categorias, dtype=object),
+                "autores": np.array(self.autores, dtype=object),
+                "vocabulario": sorted(self.postings),
+            }
+        return self._cache
+
+    def _expandir(self, termino):
+        """(token, peso) del vocabulario que coinciden con `termino`, exacto o como prefijo."""
+        if len(termino) < LARGO_MINIMO_PREFIJO:
+            return [(termino, 1.0)] if termino in self.postings else []
+        vocab = self._arrays()["vocabulario"]
+        i = bisect_left(vocab, termino)
+        encontrados = []
+        while i < len(vocab) and vocab[i].startswith(termino):
+            encontrados.append((vocab[i], 1.0 if vocab[i] == termino else PESO_PREFIJO))
+            i += 1
+        return encontrados
+
+    def autores_distintos(self):
+        return sorted({a for a in self.autores if a})
+
+    def buscar(self, consulta="", centro=None, categoria=None, desde=None, hasta=None, autor=None):
+        """Posiciones de las notas que contienen todos los términos de `consulta` y pasan los
+        filtros, con su puntaje: de mayor relevancia (BM25) a menor y, a igual puntaje, de la
+        más nueva a la más vieja. Sin consulta devuelve las que pasan los filtros por fecha."""
+        n = self.n_docs
+        if n == 0: return np.zeros(0, dtype=np.int64), np.zeros(0)
+        a = self._arrays()
+        mascara = np.ones(n, dtype=bool)
+        if centro is not None: mascara &= a["centros"] == centro
+        if categoria is not None: mascara &= a["categorias"] == categoria
+        if autor is not None: mascara &= a["autores"] == autor
+        if desde is not None: mascara &= a["fechas"] >= desde.toordinal()
+        if hasta is not None: mascara &= a["fechas"] <= hasta.toordinal()
+        puntaje = np.zeros(n)
+        largo_medio = max(a["largos"].mean(), 1.0)
+        for termino in dict.fromkeys(terminos(consulta)):
+            aparece = np.zeros(n, dtype=bool)
+            for token, peso in self._expandir(termino):
+                docs, tfs = self.postings[token]
+                d = np.frombuffer(docs, dtype=np.uint32)
+                tf = np.frombuffer(tfs, dtype=np.uint32).astype(np.float64)
+                idf = math.log(1 + (n - len(d) + 0.5) / (len(d) + 0.5))
+                puntaje[d] += peso * idf * tf * (K1 + 1) / (tf + K1 * (1 - B + B * a["largos"][d] / largo_medio))
+                aparece[d] = True
+            mascara &= aparece
+        docs = np.flatnonzero(mascara)
+        orden = np.lexsort((-a["fechas"][docs], -puntaje[docs]))
+        return docs[orden], puntaje[docs[orden]]
+
+def reconstruir_busqueda(datos):
+    return IndiceBitacora().con_filas(datos[3])
+
+def aplicar_busqueda(anterior, datos, deltas):
+    nuevas = deltas[3]
+    if nuevas.empty: return anterior
+    if anterior.n_docs != len(datos[3]) - len(nuevas):
+        # Las posiciones no cierran (no debería pasar): mejor rearmarlo entero.
+        return reconstruir_busqueda(datos)
+    return anterior.con_filas(nuevas)
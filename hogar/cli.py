@@ -0,0 +1,227 @@
+import argparse
+import os
+import sys
+from datetime import date, timedelta
+
+import pandas as pd
+
+from . import config
+from .helpers import CENTROS, clean_string, centro_canonico, get_today_ar, filter_personas_centro
+from .conexion import ClienteCentro, crear_cliente
+from .datos import (
+    SnapshotDatos, fetch_all_data_supabase, tablas_datos, guardar_snapshot, leer_snapshot,
+    asistencia_nominal, nombres_por_id, backfill_persona_ids, migrar_a_formato_compacto,
+)
+from .analisis import (
+    INDICES_DERIVADOS, RETENCION_EN_RIESGO, clasificar_frecuencias, frecuencias_padron, cobertura_actividades,
+    resumen_cobertura_diaria, cumplimiento_por_coordinador, cumpleanos, ausencias_consecutivas, tabla_auditoria,
+    tabla_contactos,
+)
+
+# ======================================================
+# LÍNEA DE COMANDOS (REPORTES, EXPORTACIONES Y PRECÁLCULO)
+# ======================================================
+# Pensada para cron: no pregunta nada, escribe los archivos de forma atómica, imprime en
+# stdout las rutas generadas y sale con código 1 (mensaje en stderr) si algo falla.
+EXPORTABLES = ["historico", "asistencia_diaria", "personas", "asistencia_nominal", "bitacora", "frecuencias", "contactos"]
+
+def _fecha(s):
+    try: return date.fromisoformat(s)
+    except ValueError: raise argparse.ArgumentTypeError(f"fecha inválida '{s}', usar AAAA-MM-DD")
+
+def _centro(s):
+    c = centro_canonico(s)
+    if c is None: raise argparse.ArgumentTypeError(f"centro desconocido '{s}' (opciones: {', '.join(CENTROS)})")
+    return c
+
+def _slug(centro):
+    return clean_string(centro).lower().replace(" ", "_") if centro else "todos"
+
+def _escribir_csv(df, ruta, index=False):
+    os.makedirs(os.path.dirname(ruta) or ".", exist_ok=True)
+    tmp = f"{ruta}.tmp"
+    df.to_csv(tmp, index=index)
+    os.replace(tmp, ruta)
+    print(ruta)
+
+def _del_centro(df, centro):
+    if centro is None or df.empty: return df
+    return df[df["centro"] == centro]
+
+def _ruta_snapshot(args, seccion):
+    return config.ruta_local(args.snapshot or config.setting(seccion, "snapshot"))
+
+def cargar_datos(args, seccion, fresco=False, centro=None):
+    """(datos, cargado_en, indices): del snapshot en disco con --usar-snapshot, si no de Supabase.
+
+    Con `centro` solo se piden a Supabase las filas de ese centro.
+    """
+    tabla = config.tabla_nominal(seccion)
+    if args.usar_snapshot and not fresco:
+        snap = leer_snapshot(_ruta_snapshot(args, seccion), tabla, config.setting(seccion, "snapshot_max_edad"))
+        if snap is not None: return snap
+        print("Snapshot ausente o vencido: se lee de Supabase.", file=sys.stderr)
+    client = crear_cliente(seccion)
+    if centro is not None: client = ClienteCentro(client, centro)
+    tablas = tablas_datos(tabla)
+    store = SnapshotDatos(lambda: fetch_all_data_supabase(client, tablas), indices=INDICES_DERIVADOS)
+    store.refrescar()
+    datos, cargado_en, _, indices = store.actual()
+    return datos, cargado_en, indices
+
+# ------------------------------------------------------
+# Subcomandos
+# ------------------------------------------------------
+def cmd_export(args, seccion):
+    (df_asistencia, df_personas, df_ap, df_seg), _, indices = cargar_datos(args, seccion, centro=args.centro)
+    centro = args.centro
+    if args.tabla == "historico":
+        df = tabla_auditoria(_del_centro(df_asistencia, centro)) if not df_asistencia.empty else df_asistencia
+    elif args.tabla == "asistencia_diaria":
+        df = _del_centro(df_asistencia, centro)
+    elif args.tabla == "personas":
+        df = filter_personas_centro(df_personas, centro).drop(columns="centro_norm", errors="ignore") if centro else df_personas
+    elif args.tabla == "asistencia_nominal":
+        df = asistencia_nominal(df_ap, centro=centro)
+        df = df.assign(nombre=df["persona_id"].map(nombres_por_id(df_personas)))
+    elif args.tabla == "bitacora":
+        df = _del_centro(df_seg, centro)
+    elif args.tabla == "frecuencias":
+        df = frecuencias_padron(filter_personas_centro(df_personas, centro) if centro else df_personas, indices["frecuencias"], get_today_ar())
+    else:
+        df = tabla_contactos(filter_personas_centro(df_personas, centro) if centro else df_personas, indices["contactos"], get_today_ar())
+        df = df.sort_values("dias_sin_contacto", ascending=False, na_position="first")
+    _escribir_csv(df, args.salida or os.path.join("exports", f"{args.tabla}_{_slug(centro)}.csv"))
+    return 0
+
+def cmd_report(args, seccion):
+    if args.hasta < args.desde:
+        print("Error: --hasta es anterior a --desde.", file=sys.stderr)
+        return 1
+    (df_asistencia, df_personas, _, _), _, indices = cargar_datos(args, seccion, centro=args.centro)
+    centro, desde, hasta = args.centro, args.desde, args.hasta
+    serie = indices["serie_diaria"]
+    dias = (hasta - desde).days + 1
+    total = serie.total(desde, hasta, centro)
+    previo = serie.total(desde - timedelta(days=dias), desde - timedelta(days=1), centro)
+    pct = (total - previo) / previo * 100 if previo else 0.0
+    cob = cobertura_actividades(df_asistencia, desde, hasta, [centro] if centro else CENTROS)
+    cargadas = int(cob["cargado"].sum()) if len(cob) else 0
+    frec = _del_centro(clasificar_frecuencias(indices["frecuencias"], hasta), centro)
+    frec = frec.assign(nombre=frec["persona_id"].map(nombres_por_id(df_personas)))
+
+    signo = "+" if pct >= 0 else ""
+    print(f"{centro or 'Todos los centros'}: {desde} a {hasta} ({dias} días)")
+    print(f"Ingresos: {total} ({total / dias:.1f} por día) · período anterior: {previo} ({signo}{pct:.1f}%)")
+    print(f"Cobertura: {cargadas}/{len(cob)} actividades cargadas ({(100 * cargadas / len(cob) if len(cob) else 0):.1f}%)")
+    print("Frecuencia: " + " · ".join(f"{k} {v}" for k, v in frec["frecuencia"].value_counts().reindex(["Diaria", "Semanal", "Mensual", "No asiste"]).fillna(0).astype(int).items()))
+
+    base = os.path.join(args.salida, f"reporte_{_slug(centro)}_{desde}_{hasta}")
+    _escribir_csv(serie.serie(desde, hasta, centro, ventanas=(7, 28)).rename_axis("fecha"), f"{base}_serie.csv", index=True)
+    _escribir_csv(cob, f"{base}_cobertura.csv")
+    _escribir_csv(frec, f"{base}_frecuencias.csv")
+    return 0
+
+def cmd_alerts(args, seccion):
+    (df_asistencia, df_personas, df_ap, _), _, indices = cargar_datos(args, seccion, centro=args.centro)
+    fecha = args.fecha
+    # Las ausencias seguidas se cuentan sobre las planillas hasta --fecha, como el resto de las alertas.
+    ap_hasta = df_ap[df_ap["fecha"].astype(str) <= fecha.isoformat()] if not df_ap.empty else df_ap
+    filas = []
+    for c in [args.centro] if args.centro else CENTROS:
+        activos = filter_personas_centro(df_personas, c)
+        activos = activos[activos["activo"].astype(str).str.upper() == "SI"] if not activos.empty else activos
+        cob = cobertura_actividades(df_asistencia, fecha, fecha, [c])
+        filas += [(c, "Actividad sin cargar", None, None, esp) for esp in cob.loc[~cob["cargado"], "espacio"]]
+        if activos.empty: continue
+        filas += [(c, "Cumpleaños", None, n, fecha.isoformat()) for n in cumpleanos(activos, fecha)]
+        ausentes = activos[activos["id"].isin(ausencias_consecutivas(ap_hasta, c))]
+        filas += [(c, "Ausencias seguidas", pid, n, None) for pid, n in zip(ausentes["id"], ausentes["nombre"])]
+        frec = frecuencias_padron(activos, indices["frecuencias"], fecha)
+        en_riesgo = frec[frec["retencion"] == "En riesgo"].sort_values("ultima_asistencia")
+        filas += [(c, f"Sin venir hace más de {RETENCION_EN_RIESGO} días", pid, n, u) for pid, n, u in zip(en_riesgo["persona_id"], en_riesgo["nombre"], en_riesgo["ultima_asistencia"])]
+    df = pd.DataFrame(filas, columns=["centro", "alerta", "persona_id", "nombre", "detalle"])
+    df["persona_id"] = df["persona_id"].astype("Int64")
+    print(f"{len(df)} alertas para {fecha}", file=sys.stderr)
+    _escribir_csv(df, args.salida or os.path.join("alertas", f"alertas_{_slug(args.centro)}_{fecha}.csv"))
+    return 0
+
+def cmd_precompute(args, seccion):
+    ruta = _ruta_snapshot(args, seccion)
+    if not ruta:
+        print("Error: no hay ruta de snapshot (usar --snapshot o `snapshot` en secrets.toml).", file=sys.stderr)
+        return 1
+    datos, cargado_en, indices = cargar_datos(args, seccion, fresco=True)
+    guardar_snapshot(ruta, config.tabla_nominal(seccion), datos, cargado_en, indices)
+    print(ruta)
+
+    df_asistencia, df_personas = datos[0], datos[1]
+    hoy = get_today_ar()
+    desde = hoy - timedelta(days=args.dias - 1)
+    cob = cobertura_actividades(df_asistencia, desde, hoy)
+    serie = indices["serie_diaria"]
+    por_centro = pd.DataFrame({c: serie.serie(desde, hoy, c)["ingresos"] for c in CENTROS}).rename_axis("fecha")
+    frec = frecuencias_padron(df_personas, indices["frecuencias"], hoy)
+    frec = frec.merge(df_personas[["id", "centro"]].rename(columns={"id": "persona_id"}), on="persona_id", how="left") if not df_personas.empty else frec
+    _escribir_csv(resumen_cobertura_diaria(cob), os.path.join(args.salida, "cobertura_diaria.csv"))
+    _escribir_csv(cumplimiento_por_coordinador(cob), os.path.join(args.salida, "cumplimiento_coordinadores.csv"))
+    _escribir_csv(por_centro, os.path.join(args.salida, "ingresos_diarios.csv"), index=True)
+    _escribir_csv(frec, os.path.join(args.salida, "frecuencias.csv"))
+    return 0
+
+def cmd_migrar_compacto(args, seccion):
+    print(f"{migrar_a_formato_compacto(crear_cliente(seccion))} planillas migradas.")
+    return 0
+
+def cmd_backfill_ids(args, seccion):
+    for origen, (resueltos, sin_resolver) in backfill_persona_ids(crear_cliente(seccion), csv_path=os.path.join(config.RAIZ, "datapersonas.csv")).items():
+        print(f"{origen}: {resueltos} resueltos, {len(sin_resolver)} sin legajo")
+        for s in sin_resolver: print(f"  {s}")
+    return 0
+
+def crear_parser():
+    parser = argparse.ArgumentParser(prog="python -m hogar", description="Reportes, exportaciones y precálculo sin abrir la app.")
+    parser.add_argument("--secrets", help=f"secrets.toml con la sección [supabase] (por defecto {config.SECRETS_PATH})")
+    parser.add_argument("--snapshot", help="ruta del snapshot precalculado (por defecto `snapshot` de secrets.toml)")
+    parser.add_argument("--usar-snapshot", action="store_true", help="leer del snapshot precalculado en vez de Supabase si está vigente")
+    sub = parser.add_subparsers(dest="comando", required=True)
+
+    p = sub.add_parser("export", help="exporta una tabla a CSV")
+    p.add_argument("--tabla", choices=EXPORTABLES, default="historico")
+    p.add_argument("--centro", type=_centro)
+    p.add_argument("--salida", help="archivo CSV (por defecto exports/<tabla>_<centro>.csv)")
+    p.set_defaults(func=cmd_export)
+
+    p = sub.add_parser("report", help="ingresos, cobertura y frecuencia de un período")
+    p.add_argument("--centro", type=_centro, help="por defecto todos los centros")
+    p.add_argument("--desde", type=_fecha, required=True)
+    p.add_argument("--hasta", type=_fecha, required=True)
+    p.add_argument("--salida", default="reportes", help="carpeta de salida")
+    p.set_defaults(func=cmd_report)
+
+    p = sub.add_parser("alerts", help="actividades sin cargar, ausencias, cumpleaños y personas que dejaron de venir")
+    p.add_argument("--centro", type=_centro, help="por defecto todos los centros")
+    p.add_argument("--fecha", type=_fecha, default=get_today_ar())
+    p.add_argument("--salida", help="archivo CSV (por defecto alertas/alertas_<centro>_<fecha>.csv)")
+    p.set_defaults(func=cmd_alerts)
+
+    p = sub.add_parser("precompute", help="guarda el snapshot para el arranque en caliente de la app y los resúmenes en CSV")
+    p.add_argument("--salida", default="precalculado", help="carpeta de los resúmenes")
+    p.add_argument("--dias", type=int, default=365, help="días hacia atrás de los resúmenes de cobertura e ingresos")
+    p.set_defaults(func=cmd_precompute)
+
+    p = sub.add_parser("migrar-compacto", help="copia asistencia_personas al formato compacto")
+    p.set_defaults(func=cmd_migrar_compacto)
+
+    p = sub.add_parser("backfill-ids", help="completa persona_id en asistencia y bitácora")
+    p.set_defaults(func=cmd_backfill_ids)
+    return parser
+
+def main(argv=None):
+    args = crear_parser().parse_args(argv)
+    try:
+        seccion = config.leer_secrets(args.secrets)
+        return args.func(args, seccion)
+    except Exception as e:
+        print(f"Error: {e}", file=sys.stderr)
+        return 1
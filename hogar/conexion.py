@@ -0,0 +1,166 @@
+import time
+import random
+import threading
+import httpx
+from postgrest.exceptions import APIError
+from supabase import create_client, ClientOptions
+
+from .config import setting
+
+# ======================================================
+# CONEXIÓN SEGURA A SUPABASE
+# ======================================================
+class CircuitoAbierto(Exception):
+    pass
+
+# Códigos de APIError que vale la pena reintentar. PostgREST devuelve el SQLSTATE de Postgres
+# o un código PGRST; si la respuesta no era JSON (un 502 del proxy), el código es el status HTTP.
+# postgrest-py solo reintenta 503/520 por su cuenta.
+CODIGOS_TRANSITORIOS = {
+    "408", "429",
+    "57014", "57P01", "57P03",   # statement timeout, reinicio del servidor
+    "40001", "40P01",            # conflicto de serialización, deadlock
+    "PGRST000", "PGRST001", "PGRST002", "PGRST003",  # sin conexión con la base / pool agotado
+}
+
+def es_transitorio(e):
+    """True si el APIError es del servidor (5xx, timeouts, conexión) y no de la consulta en sí."""
+    code = str(e.code or "")
+    if code in CODIGOS_TRANSITORIOS: return True
+    if len(code) == 3 and code.isdigit(): return code.startswith("5")
+    return len(code) == 5 and code[:2] in ("08", "53")  # connection_exception, insufficient_resources
+
+class SupabaseResiliente:
+    """Cliente de Supabase con reintentos para lecturas y circuit breaker.
+
+    Las escrituras (insert/delete) pasan directo por `table()` sin reintentos, porque
+    no son idempotentes. Las lecturas van por `leer()`.
+    """
+
+    def __init__(self, client, reintentos=3, backoff_base=0.4, backoff_max=4.0, umbral_fallas=3, enfriamiento=30.0):
+        self.client = client
+        self.reintentos = reintentos
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.umbral_fallas = umbral_fallas
+        self.enfriamiento = enfriamiento
+        self._lock = threading.Lock()
+        self.fallas_consecutivas = 0
+        self.abierto_hasta = 0.0
+        self.ultimo_error = None
+
+    def table(self, nombre):
+        return self.client.table(nombre)
+
+    def circuito_abierto(self):
+        return time.monotonic() < self.abierto_hasta
+
+    def _registrar_exito(self):
+        with self._lock:
+            self.fallas_consecutivas = 0
+            self.abierto_hasta = 0.0
+            self.ultimo_error = None
+
+    def _registrar_falla(self, e):
+        with self._lock:
+            self.fallas_consecutivas += 1
+            self.ultimo_error = str(e)
+            if self.fallas_consecutivas >= self.umbral_fallas:
+                self.abierto_hasta = time.monotonic() + self.enfriamiento
+
+    def leer(self, construir_query):
+        """Ejecuta una lectura idempotente. `construir_query` arma el request de cero en cada intento."""
+        if self.circuito_abierto():
+            raise CircuitoAbierto(f"Supabase no responde, reintento en {int(self.abierto_hasta - time.monotonic()) + 1}s ({self.ultimo_error})")
+        ultimo = None
+        for intento in range(self.reintentos + 1):
+            try:
+                res = construir_query().execute()
+                self._registrar_exito()
+                return res
+            except APIError as e:
+                # Error de la consulta en sí (permisos, columnas): reintentar no cambia nada, y
+                # tampoco cuenta para el circuito, porque Supabase sí está respondiendo.
+                if not es_transitorio(e): raise
+                ultimo = e
+                if intento < self.reintentos:
+                    time.sleep(random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** intento))))
+            except Exception as e:
+                ultimo = e
+                if intento < self.reintentos:
+                    time.sleep(random.uniform(0, min(self.backoff_max, self.backoff_base * (2 ** intento))))
+        self._registrar_falla(ultimo)
+        raise ultimo
+
+def crear_cliente(seccion) -> SupabaseResiliente:
+    """Cliente resiliente a partir de la sección [supabase] de secrets.toml."""
+    timeout = httpx.Timeout(setting(seccion, "timeout_lectura"), connect=setting(seccion, "timeout_conexion"))
+    # Un único pool HTTP keep-alive compartido por todas las sesiones del proceso.
+    http = httpx.Client(timeout=timeout, limits=httpx.Limits(max_connections=20, max_keepalive_connections=10))
+    client = create_client(seccion["url"], seccion["key"], options=ClientOptions(postgrest_client_timeout=timeout, httpx_client=http))
+    return SupabaseResiliente(
+        client,
+        reintentos=setting(seccion, "reintentos"), backoff_base=setting(seccion, "backoff_base"),
+        backoff_max=setting(seccion, "backoff_max"), umbral_fallas=setting(seccion, "umbral_fallas"),
+        enfriamiento=setting(seccion, "enfriamiento"),
+    )
+
+# ======================================================
+# ALCANCE POR CENTRO (REEMPLAZO LOCAL DE ROW LEVEL SECURITY)
+# ======================================================
+# Tablas con columna `centro`; todo lo demás (usuarios) pasa sin filtro.
+TABLAS_POR_CENTRO = {"asistencia_diaria", "personas", "asistencia_personas", "planillas_asistencia", "bitacora_seguimiento", "padrones"}
+
+class FueraDeCentro(PermissionError):
+    pass
+
+class _TablaCentro:
+    def __init__(self, builder, tabla, centro):
+        self._builder = builder
+        self._tabla = tabla
+        self._centro = centro
+
+    def _validar(self, filas):
+        for f in filas if isinstance(filas, list) else [filas]:
+            if f.get("centro", self._centro) != self._centro:
+                raise FueraDeCentro(f"{self._tabla}: no se puede escribir en '{f.get('centro')}' desde una sesión de '{self._centro}'")
+
+    def select(self, *args, **kwargs):
+        return self._builder.select(*args, **kwargs).eq("centro", self._centro)
+
+    def insert(self, filas, *args, **kwargs):
+        self._validar(filas)
+        return self._builder.insert(filas, *args, **kwargs)
+
+    def update(self, valores, *args, **kwargs):
+        self._validar(valores)
+        return self._builder.update(valores, *args, **kwargs).eq("centro", self._centro)
+
+    def delete(self, *args, **kwargs):
+        return self._builder.delete(*args, **kwargs).eq("centro", self._centro)
+
+    def __getattr__(self, nombre):
+        raise AttributeError(f"{nombre} no está permitido en una sesión limitada a un centro")
+
+class ClienteCentro:
+    """Vista de un SupabaseResiliente limitada a un centro.
+
+    Toda lectura, actualización o borrado de las tablas de TABLAS_POR_CENTRO lleva
+    `eq("centro", centro)` y las inserciones de otro centro se rechazan con FueraDeCentro,
+    así una sesión de coordinador solo baja (y solo toca) las filas de su centro aunque la
+    base acepte todo con la key anónima. Comparte pool, reintentos y circuito con `base`.
+    """
+
+    def __init__(self, base, centro):
+        self.base = base
+        self.centro = centro
+
+    def table(self, nombre):
+        builder = self.base.table(nombre)
+        return _TablaCentro(builder, nombre, self.centro) if nombre in TABLAS_POR_CENTRO else builder
+
+    def leer(self, construir_query):
+        return self.base.leer(construir_query)
+
+    def __getattr__(self, nombre):
+        return getattr(self.base, nombre)
@@ -0,0 +1,41 @@
+import os
+import tomllib
+
+# ======================================================
+# CONFIGURACIÓN (SECRETS.TOML SIN STREAMLIT)
+# ======================================================
+RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SECRETS_PATH = os.path.join(RAIZ, ".streamlit", "secrets.toml")
+
+# Parámetros opcionales en [supabase] de secrets.toml; si faltan se usan estos valores.
+SUPABASE_DEFAULTS = {
+    "timeout_conexion": 4.0,   # segundos para abrir la conexión
+    "timeout_lectura": 10.0,   # segundos de espera por respuesta
+    "reintentos": 3,           # reintentos extra para lecturas idempotentes
+    "backoff_base": 0.4,       # segundos, se duplica en cada intento (con jitter)
+    "backoff_max": 4.0,
+    "umbral_fallas": 3,        # fallas seguidas que abren el circuito
+    "enfriamiento": 30.0,      # segundos con el circuito abierto antes de volver a probar
+    "refresco": 3.0,           # segundos entre consultas de novedades en segundo plano
+    "recarga_completa": 300.0, # segundos entre recargas completas (levanta borrados hechos por otros procesos)
+    "formato_asistencia": "filas",  # "filas" (asistencia_personas) o "compacto" (planillas_asistencia + padrones)
+    "snapshot": ".cache/snapshot.pkl",  # snapshot precalculado por `python -m hogar precompute` ("" lo desactiva)
+    "snapshot_max_edad": 36 * 3600.0,   # segundos; un snapshot más viejo no se usa para arrancar
+}
+
+def leer_secrets(ruta=None):
+    """Sección [supabase] de secrets.toml leída sin Streamlit (para la línea de comandos)."""
+    with open(ruta or SECRETS_PATH, "rb") as f:
+        return tomllib.load(f).get("supabase", {})
+
+def setting(seccion, clave):
+    default = SUPABASE_DEFAULTS[clave]
+    try: return type(default)(seccion.get(clave, default))
+    except: return default
+
+def tabla_nominal(seccion):
+    return "planillas_asistencia" if setting(seccion, "formato_asistencia") == "compacto" else "asistencia_personas"
+
+def ruta_local(ruta):
+    """Las rutas relativas de la configuración se toman desde la raíz del repo, no desde el cwd."""
+    return ruta if not ruta or os.path.isabs(ruta) else os.path.join(RAIZ, ruta)
@@ -0,0 +1,472 @@
+import pandas as pd
+from datetime import timedelta
+import time
+import re
+import os
+import pickle
+import threading
+
+from .helpers import clean_string, year_of
+
+# ======================================================
+# FLUJO DE DATOS CONEXIÓN REAL A SUPABASE
+# ======================================================
+# Asistencia nominal: en formato "filas" hay una fila por persona y planilla (presentes y
+# ausentes); en formato "compacto" hay una fila por planilla con el array de ids presentes y
+# una referencia al padrón vigente al guardarla (tabla `padrones`), de donde salen los ausentes.
+COLUMNAS_TABLAS = {
+    "asistencia_diaria": ["created_at", "fecha", "anio", "centro", "espacio", "presentes", "coordinador", "modo", "notas", "usuario", "accion"],
+    "personas": ["id", "nombre", "centro", "domicilio", "notas", "activo", "dni", "fecha_nacimiento", "telefono", "contacto_emergencia", "etiquetas"],
+    "asistencia_personas": ["created_at", "fecha", "anio", "centro", "espacio", "persona_id", "nombre", "estado", "es_nuevo", "coordinador", "usuario"],
+    "planillas_asistencia": ["id", "created_at", "fecha", "anio", "centro", "espacio", "coordinador", "usuario", "presentes", "padron_id", "padron"],
+    "bitacora_seguimiento": ["created_at", "fecha", "anio", "centro", "persona_id", "nombre_persona", "categoria", "observacion", "usuario_registro"],
+}
+
+def tablas_datos(tabla_nominal):
+    """Tablas que forman el snapshot, en el orden de la tupla (asistencia, personas, nominal, bitácora)."""
+    return ("asistencia_diaria", "personas", tabla_nominal, "bitacora_seguimiento")
+
+# Tablas que además del persona_id guardan el nombre tal como se escribió.
+COLUMNA_NOMBRE = {"asistencia_personas": "nombre", "bitacora_seguimiento": "nombre_persona"}
+MARGEN_NOVEDADES = timedelta(seconds=30)  # created_at lo fija el inicio de la transacción, no el commit
+
+def fetch_tabla(client, tabla, desde=None, previo=None):
+    # De a páginas ordenadas por id: PostgREST corta cada select en 1000 filas sin avisar.
+    if desde is None:
+        filas = _paginar(client, lambda: client.table(tabla).select("*").order("id"))
+    else:
+        filas = _paginar(client, lambda: client.table(tabla).select("*").gt("created_at", desde).order("id"))
+    df = pd.DataFrame(filas) if filas else pd.DataFrame(columns=COLUMNAS_TABLAS[tabla])
+    if tabla == "planillas_asistencia" and not df.empty:
+        df = adjuntar_padrones(client, df, previo)
+    return df
+
+def adjuntar_padrones(client, df, previo=None):
+    """Convierte los arrays a tuplas y cuelga de cada planilla la tupla de su padrón.
+
+    Todas las planillas que comparten padrón apuntan al mismo objeto, así el padrón ocupa
+    memoria una sola vez. Solo se piden a Supabase los padrones que no estén ya en `previo`.
+    """
+    conocidos = {}
+    if previo is not None and not previo.empty and "padron" in previo.columns:
+        conocidos = dict(zip(previo["padron_id"], previo["padron"]))
+    faltan = [int(i) for i in df["padron_id"].dropna().unique() if i not in conocidos]
+    if faltan:
+        filas = _paginar(client, lambda: client.table("padrones").select("id, personas").in_("id", faltan).order("id"))
+        conocidos.update({r["id"]: tuple(r["personas"] or ()) for r in filas})
+    df = df.copy()
+    df["presentes"] = df["presentes"].map(lambda v: tuple(v) if isinstance(v, (list, tuple)) else ())
+    df["padron"] = df["padron_id"].map(lambda i: conocidos.get(i, ()))
+    return df
+
+def fetch_all_data_supabase(client, tablas):
+    datos = [fetch_tabla(client, tabla) for tabla in tablas]
+    resolver = ResolverPersonas(datos[1])
+    return tuple(completar_persona_id(df, resolver, COLUMNA_NOMBRE[t]) if t in COLUMNA_NOMBRE else df for t, df in zip(tablas, datos))
+
+def marca_created_at(df):
+    if df.empty or "created_at" not in df.columns: return None
+    ts = pd.to_datetime(df["created_at"], errors="coerce", utc=True, format="ISO8601").max()
+    return None if pd.isna(ts) else ts
+
+def fetch_novedades_supabase(client, datos, tablas):
+    """Feed de cambios por sondeo: trae solo las filas con `created_at` posterior a lo que ya hay en memoria.
+
+    Es el reemplazo local de Supabase Realtime (el cliente sincrónico no lo soporta). Solo ve
+    inserciones; los borrados de modo "Corregir datos" de otro proceso llegan con la próxima
+    recarga completa. Devuelve `(datos, deltas)`, donde `deltas` son solo las filas nuevas de
+    cada tabla, o None si no hubo cambios.
+    """
+    nuevos = []
+    deltas = []
+    hubo_cambios = False
+    for tabla, df in zip(tablas, datos):
+        if df.empty:
+            df_nov = fetch_tabla(client, tabla)
+            if tabla in COLUMNA_NOMBRE: df_nov = completar_persona_id(df_nov, ResolverPersonas(nuevos[1]), COLUMNA_NOMBRE[tabla])
+            nuevos.append(df if df_nov.empty else df_nov)
+            deltas.append(df_nov)
+            hubo_cambios = hubo_cambios or not df_nov.empty
+            continue
+        marca = marca_created_at(df)
+        if marca is None:
+            nuevos.append(df)
+            deltas.append(df.iloc[0:0])
+            continue
+        desde = marca - MARGEN_NOVEDADES
+        df_nov = fetch_tabla(client, tabla, desde=desde.isoformat(), previo=df)
+        if not df_nov.empty:
+            # La ventana se solapa con lo ya cargado: descartar las filas que ya están.
+            df_ventana = df[pd.to_datetime(df["created_at"], errors="coerce", utc=True, format="ISO8601") > desde]
+            claves = ["id"] if "id" in df.columns and "id" in df_nov.columns else [c for c in df.columns if c in df_nov.columns and c not in ("padron", "persona_id")]
+            ya = df_ventana[claves].astype(str).agg("|".join, axis=1)
+            df_nov = df_nov[~df_nov[claves].astype(str).agg("|".join, axis=1).isin(set(ya))]
+        if tabla in COLUMNA_NOMBRE and not df_nov.empty:
+            # personas va antes en `tablas`, así que nuevos[1] ya incluye las altas de este sondeo.
+            df_nov = completar_persona_id(df_nov, ResolverPersonas(nuevos[1]), COLUMNA_NOMBRE[tabla])
+        deltas.append(df_nov)
+        if df_nov.empty:
+            nuevos.append(df)
+        else:
+            nuevos.append(pd.concat([df, df_nov], ignore_index=True))
+            hubo_cambios = True
+    return (tuple(nuevos), tuple(deltas)) if hubo_cambios else None
+
+def filtrar_centro(datos, centro):
+    """Las mismas tablas con solo las filas de `centro` (para recortar un snapshot de toda la federación)."""
+    return tuple(df[df["centro"] == centro] if "centro" in df.columns else df for df in datos)
+
+def _hash_tabla(df):
+    try: filas = pd.util.hash_pandas_object(df, index=False)
+    except TypeError: filas = pd.util.hash_pandas_object(df.astype(str), index=False)  # columnas con listas/dicts
+    return int(filas.sum())
+
+def huella_datos(datos):
+    """Resumen del contenido de cada tabla: cambia con altas, bajas y también con UPDATEs en el lugar
+    (renombrar a alguien, pasarlo a inactivo, completar persona_id), que no tocan `created_at`."""
+    return tuple((len(df), tuple(df.columns), _hash_tabla(df)) for df in datos)
+
+# ======================================================
+# IDENTIDAD DE PERSONAS (ID ENTERO ESTABLE)
+# ======================================================
+def clave_nombre(s):
+    """Forma canónica de un nombre para resolverlo contra el padrón: sin tildes ni puntuación,
+    en mayúsculas y con las palabras ordenadas ("Acosta, Carlos" == "CARLOS ACOSTA")."""
+    return " ".join(sorted(re.sub(r"[^A-Z0-9 ]", " ", clean_string(s)).split()))
+
+class ResolverPersonas:
+    """Resuelve nombres escritos a mano contra `personas.id`.
+
+    Primero busca en el mismo centro; si no hay coincidencia, acepta la de otro centro solo
+    cuando es única en toda la federación. Dos homónimos en el mismo centro no se resuelven:
+    devuelve None en vez de adivinar, así quedan en la lista de `sin_resolver`.
+    """
+
+    def __init__(self, df_personas):
+        self.por_centro = {}
+        self.por_clave = {}
+        self.ambiguos = set()  # (centro, clave) con más de un legajo
+        if df_personas.empty or "id" not in df_personas.columns: return
+        for pid, nombre, centro in zip(df_personas["id"], df_personas["nombre"], df_personas["centro"]):
+            k = clave_nombre(nombre)
+            ck = (clean_string(centro), k)
+            if self.por_centro.setdefault(ck, int(pid)) != int(pid): self.ambiguos.add(ck)
+            self.por_clave.setdefault(k, set()).add(int(pid))
+
+    def resolver(self, nombre, centro=None):
+        k = clave_nombre(nombre)
+        if (clean_string(centro), k) in self.ambiguos: return None
+        pid = self.por_centro.get((clean_string(centro), k))
+        if pid is None and len(self.por_clave.get(k, ())) == 1:
+            pid = next(iter(self.por_clave[k]))
+        return pid
+
+def completar_persona_id(df, resolver, col_nombre):
+    """Completa en memoria el persona_id de las filas que todavía no lo tienen guardado."""
+    if df.empty or col_nombre not in df.columns: return df
+    df = df.copy()
+    if "persona_id" not in df.columns: df["persona_id"] = None
+    faltan = df["persona_id"].isna()
+    if faltan.any():
+        pares = df.loc[faltan, [col_nombre, "centro"]].drop_duplicates()
+        mapa = {(n, c): resolver.resolver(n, c) for n, c in zip(pares[col_nombre], pares["centro"])}
+        df.loc[faltan, "persona_id"] = [mapa[(n, c)] for n, c in zip(df.loc[faltan, col_nombre], df.loc[faltan, "centro"])]
+    df["persona_id"] = pd.to_numeric(df["persona_id"], errors="coerce").astype("Int64")
+    return df
+
+def nombres_por_id(df_personas):
+    if df_personas.empty: return {}
+    return dict(zip(df_personas["id"], df_personas["nombre"]))
+
+def filas_de_persona(df, persona_id):
+    if df.empty or "persona_id" not in df.columns: return df.iloc[0:0]
+    return df[df["persona_id"].eq(persona_id).fillna(False).astype(bool)]
+
+def _paginar(client, construir_query, pagina=1000):
+    filas = []
+    while True:
+        desde = len(filas)
+        res = client.leer(lambda: construir_query().range(desde, desde + pagina - 1))
+        filas.extend(res.data or [])
+        if len(res.data or []) < pagina: return filas
+
+def _tabla_paginada(client, tabla, columnas="*"):
+    """Toda la tabla de a páginas; PostgREST corta cada select en 1000 filas."""
+    filas = _paginar(client, lambda: client.table(tabla).select(columnas).order("id"))
+    return pd.DataFrame(filas) if filas else pd.DataFrame(columns=COLUMNAS_TABLAS.get(tabla, []))
+
+def backfill_persona_ids(client, csv_path="datapersonas.csv"):
+    """Guarda persona_id en asistencia_personas y bitacora_seguimiento resolviendo los nombres.
+
+    Solo toca filas con persona_id nulo, así que se puede correr las veces que haga falta.
+    También resuelve los nombres de `csv_path` (el listado importado originalmente) para
+    mostrar cuáles no tienen legajo. Devuelve {tabla: (filas_por_nombre_resueltas, sin_resolver)}.
+    """
+    resolver = ResolverPersonas(_tabla_paginada(client, "personas"))
+    resumen = {}
+    for tabla, col in COLUMNA_NOMBRE.items():
+        filas = _paginar(client, lambda: client.table(tabla).select(f"id, {col}, centro").is_("persona_id", "null").order("id"))
+        pares = sorted({(r[col], r["centro"]) for r in filas if r.get(col)})
+        resueltos, sin_resolver = 0, []
+        for nombre, centro in pares:
+            pid = resolver.resolver(nombre, centro)
+            if pid is None:
+                sin_resolver.append(f"{nombre} ({centro})")
+                continue
+            client.table(tabla).update({"persona_id": pid}).eq(col, nombre).eq("centro", centro).is_("persona_id", "null").execute()
+            resueltos += 1
+        resumen[tabla] = (resueltos, sin_resolver)
+    if csv_path and os.path.exists(csv_path):
+        csv = pd.read_csv(csv_path)
+        csv.columns = [c.strip() for c in csv.columns]
+        sin_legajo = [f"{p} ({c})" for p, c in zip(csv["persona"], csv["centro"]) if resolver.resolver(p, str(c).strip()) is None]
+        resumen[os.path.basename(csv_path)] = (len(csv) - len(sin_legajo), sin_legajo)
+    return resumen
+
+# ======================================================
+# ASISTENCIA NOMINAL: LECTURA DE AMBOS FORMATOS
+# ======================================================
+def es_formato_compacto(df_ap):
+    return "padron" in df_ap.columns
+
+def presencias_nominales(df_ap):
+    """Filas (persona_id, centro, fecha) de cada presente. En formato compacto no toca los padrones."""
+    cols = ["persona_id", "centro", "fecha"]
+    if df_ap.empty: return pd.DataFrame(columns=cols)
+    if not es_formato_compacto(df_ap):
+        if "estado" not in df_ap.columns: return pd.DataFrame(columns=cols)
+        return df_ap.loc[df_ap["estado"] == "Presente", cols].dropna(subset=["persona_id"])
+    pres = df_ap[["fecha", "centro", "presentes"]].explode("presentes").dropna(subset=["presentes"])
+    return pres.rename(columns={"presentes": "persona_id"})[cols]
+
+def asistencia_nominal(df_ap, fechas=None, centro=None):
+    """Vista de una fila por persona y planilla (fecha, centro, espacio, persona_id, estado).
+
+    En formato compacto solo se expanden las planillas que pasan el filtro, contra el
+    padrón que estaba vigente cuando se guardaron.
+    """
+    cols = ["fecha", "centro", "espacio", "persona_id", "estado"]
+    if df_ap.empty: return pd.DataFrame(columns=cols)
+    d = df_ap
+    if fechas is not None: d = d[d["fecha"].isin(fechas)]
+    if centro is not None: d = d[d["centro"] == centro]
+    if not es_formato_compacto(d): return d[cols]
+    filas = []
+    for fecha, c, esp, presentes, padron in zip(d["fecha"], d["centro"], d["espacio"], d["presentes"], d["padron"]):
+        pres = set(presentes)
+        filas.extend((fecha, c, esp, n, "Presente" if n in pres else "Ausente") for n in padron)
+        filas.extend((fecha, c, esp, n, "Presente") for n in pres.difference(padron))
+    return pd.DataFrame(filas, columns=cols)
+
+def padron_vigente(df_ap, centro):
+    """(padron_id, ids) del último padrón usado en una planilla compacta del centro."""
+    if df_ap.empty or not es_formato_compacto(df_ap): return None, ()
+    d = df_ap[df_ap["centro"] == centro]
+    if d.empty: return None, ()
+    ultima = d.sort_values("created_at").iloc[-1]
+    return ultima["padron_id"], ultima["padron"]
+
+def guardar_planilla_compacta(client, df_ap, cabecera, presentes_ids, padron_ids):
+    """Inserta una planilla compacta; el padrón se reutiliza si no cambió desde la última."""
+    padron = tuple(sorted(int(i) for i in padron_ids))
+    padron_id, padron_prev = padron_vigente(df_ap, cabecera["centro"])
+    if padron_id is None or tuple(padron_prev) != padron:
+        res = client.table("padrones").insert({"centro": cabecera["centro"], "personas": list(padron)}).execute()
+        padron_id = res.data[0]["id"]
+    fila = {k: cabecera[k] for k in ["fecha", "anio", "centro", "espacio", "coordinador", "usuario"]}
+    fila.update({"presentes": sorted(int(i) for i in presentes_ids), "padron_id": int(padron_id)})
+    client.table("planillas_asistencia").insert(fila).execute()
+
+def migrar_a_formato_compacto(client, lote=500):
+    """Copia asistencia_personas a planillas_asistencia + padrones. Se puede volver a correr:
+    las planillas que ya existen en el formato compacto se saltean. Las filas cuyo nombre no
+    se puede resolver a un persona_id quedan afuera de los arrays."""
+    df = completar_persona_id(_tabla_paginada(client, "asistencia_personas"), ResolverPersonas(_tabla_paginada(client, "personas")), "nombre")
+    df = df.dropna(subset=["persona_id"]) if not df.empty else df
+    if df.empty: return 0
+    existentes = _paginar(client, lambda: client.table("planillas_asistencia").select("id, fecha, centro, espacio").order("id"))
+    ya = {(r["fecha"], r["centro"], r["espacio"]) for r in existentes}
+    df = df.assign(fecha=df["fecha"].astype(str)).sort_values("created_at")
+    planillas = []
+    padrones = {}
+    for (fecha, centro, espacio), g in df.groupby(["fecha", "centro", "espacio"], sort=False):
+        if (fecha, centro, espacio) in ya: continue
+        padron = tuple(sorted(int(i) for i in g["persona_id"].unique()))
+        padrones.setdefault((centro, padron), None)
+        ultima = g.iloc[-1]
+        planillas.append({
+            "created_at": ultima["created_at"], "fecha": fecha, "anio": str(ultima.get("anio") or year_of(fecha)),
+            "centro": centro, "espacio": espacio, "coordinador": ultima.get("coordinador"), "usuario": ultima.get("usuario"),
+            "presentes": sorted(int(i) for i in g.loc[g["estado"] == "Presente", "persona_id"].unique()), "_padron": (centro, padron),
+        })
+    claves = list(padrones)
+    for i in range(0, len(claves), lote):
+        res = client.table("padrones").insert([{"centro": c, "personas": list(n)} for c, n in claves[i:i + lote]]).execute()
+        padrones.update(zip(claves[i:i + lote], (r["id"] for r in res.data)))
+    for p in planillas: p["padron_id"] = padrones[p.pop("_padron")]
+    for i in range(0, len(planillas), lote):
+        client.table("planillas_asistencia").insert(planillas[i:i + lote]).execute()
+    return len(planillas)
+
+class SnapshotDatos:
+    """Almacén de datos único por proceso, compartido por todas las sesiones de Streamlit.
+
+    Las sesiones leen `actual()` sin esperar a Supabase. Un hilo en segundo plano consulta
+    novedades cada `intervalo` segundos (o cuando alguien llama a `pedir_refresco()`) y hace
+    una recarga completa cada `recarga_completa` segundos. Cada cambio reemplaza la tupla
+    completa de una sola vez, así ninguna sesión ve una mezcla de tablas viejas y nuevas, y
+    sube `version()`, que es lo que miran las sesiones suscriptas. Si una recarga falla se
+    sigue sirviendo el último snapshot bueno.
+
+    `indices` son estructuras derivadas que se publican junto con cada snapshot:
+    `{nombre: (reconstruir, aplicar)}`. `reconstruir(datos)` las arma de cero tras una
+    recarga completa; `aplicar(anterior, datos, deltas)` las actualiza solo con las filas
+    nuevas que trajo el feed de cambios (si es None, se reconstruye siempre).
+    """
+
+    def __init__(self, cargar, novedades=None, intervalo=3.0, recarga_completa=300.0, indices=None):
+        self._cargar = cargar
+        self._novedades = novedades
+        self._indices = indices or {}
+        self.intervalo = intervalo
+        self.recarga_completa = recarga_completa
+        self._snap = None  # (datos, cargado_en, version, indices)
+        self._ultima_completa = 0.0
+        self._lock_carga = threading.Lock()
+        self._cambio = threading.Condition()
+        self._pedido = threading.Event()
+        self._pedido_completo = False
+        self._hilo = None
+        self.ultimo_error = None
+        self.falla_desde = None
+
+    def actual(self):
+        return self._snap
+
+    def version(self):
+        return self._snap[2] if self._snap else 0
+
+    def _calcular_indices(self, datos, deltas):
+        anteriores = self._snap[3] if self._snap else {}
+        indices = {}
+        for nombre, (reconstruir, aplicar) in self._indices.items():
+            if deltas is not None and aplicar is not None and nombre in anteriores:
+                indices[nombre] = aplicar(anteriores[nombre], datos, deltas)
+            else:
+                indices[nombre] = reconstruir(datos)
+        return indices
+
+    def _publicar(self, datos, deltas=None):
+        indices = self._calcular_indices(datos, deltas)
+        with self._cambio:
+            self._snap = (datos, time.time(), self.version() + 1, indices)
+            self._cambio.notify_all()
+
+    def _marcar_vigente(self):
+        with self._cambio:
+            datos, _, version, indices = self._snap
+            self._snap = (datos, time.time(), version, indices)
+
+    def _ejecutar(self, paso):
+        try:
+            paso()
+        except Exception as e:
+            self.ultimo_error = str(e)
+            if self.falla_desde is None: self.falla_desde = time.time()
+            raise
+        self.ultimo_error = None
+        self.falla_desde = None
+
+    def refrescar(self, solo_si_vacio=False):
+        with self._lock_carga:
+            if solo_si_vacio and self._snap is not None: return
+            def paso():
+                datos = self._cargar()
+                self._ultima_completa = time.time()
+                if self._snap is not None and huella_datos(datos) == huella_datos(self._snap[0]):
+                    self._marcar_vigente()
+                else:
+                    self._publicar(datos)
+            self._ejecutar(paso)
+
+    def aplicar_novedades(self):
+        with self._lock_carga:
+            if self._snap is None or self._novedades is None: return
+            def paso():
+                cambios = self._novedades(self._snap[0])
+                if cambios is None: self._marcar_vigente()
+                else: self._publicar(*cambios)
+            self._ejecutar(paso)
+
+    def sembrar(self, datos, cargado_en, indices=None):
+        """Arranca con un snapshot precalculado (ver `leer_snapshot`) mientras no haya uno propio.
+
+        `cargado_en` conserva la hora real de esos datos, y como no cuenta como recarga
+        completa el hilo de fondo hace una apenas arranca. Los índices que no vengan en el
+        snapshot (o que cambiaron de nombre) se reconstruyen acá.
+        """
+        with self._lock_carga:
+            if self._snap is not None: return
+            if not indices or set(indices) != set(self._indices):
+                indices = {nombre: reconstruir(datos) for nombre, (reconstruir, _) in self._indices.items()}
+            with self._cambio:
+                self._snap = (datos, cargado_en, 1, indices)
+                self._cambio.notify_all()
+
+    def asegurar_cargado(self):
+        if self._snap is None: self.refrescar(solo_si_vacio=True)
+
+    def pedir_refresco(self, completo=False):
+        if completo: self._pedido_completo = True
+        self._pedido.set()
+
+    def esperar_version(self, version, timeout):
+        """Espera (como mucho `timeout` segundos) a que se publique un snapshot más nuevo que `version`."""
+        with self._cambio:
+            return self._cambio.wait_for(lambda: self.version() > version, timeout=timeout)
+
+    def _bucle(self):
+        while True:
+            self._pedido.wait(self.intervalo)
+            self._pedido.clear()
+            completo = self._pedido_completo or self._novedades is None or time.time() - self._ultima_completa >= self.recarga_completa
+            self._pedido_completo = False
+            try:
+                if completo: self.refrescar()
+                else: self.aplicar_novedades()
+            except Exception: pass
+
+    def iniciar(self):
+        if self._hilo is None:
+            self._hilo = threading.Thread(target=self._bucle, name="refresco-datos", daemon=True)
+            self._hilo.start()
+
+    def edad_segundos(self):
+        return time.time() - self._snap[1] if self._snap else None
+
+# ======================================================
+# SNAPSHOT EN DISCO (ARRANQUE EN CALIENTE)
+# ======================================================
+# Lo escribe `python -m hogar precompute` (por cron) y lo lee la app al crear el almacén,
+# así la primera sesión después de un reinicio no espera la carga completa de Supabase.
+# Es un pickle local generado por este mismo código: no apuntarlo a archivos de terceros.
+VERSION_SNAPSHOT = 1
+
+def guardar_snapshot(ruta, tabla_nominal, datos, cargado_en, indices):
+    os.makedirs(os.path.dirname(ruta) or ".", exist_ok=True)
+    tmp = f"{ruta}.tmp"
+    with open(tmp, "wb") as f:
+        pickle.dump({"version": VERSION_SNAPSHOT, "tabla_nominal": tabla_nominal, "cargado_en": cargado_en, "datos": datos, "indices": indices}, f, protocol=pickle.HIGHEST_PROTOCOL)
+    os.replace(tmp, ruta)  # quien lo esté leyendo ve el archivo viejo o el nuevo, nunca uno a medias
+
+def leer_snapshot(ruta, tabla_nominal, max_edad=None):
+    """(datos, cargado_en, indices) del snapshot en disco, o None si no existe, es de otro
+    formato de asistencia o tiene más de `max_edad` segundos."""
+    if not ruta or not os.path.exists(ruta): return None
+    try:
+        with open(ruta, "rb") as f: snap = pickle.load(f)
+    except Exception:
+        return None
+    if snap.get("version") != VERSION_SNAPSHOT or snap.get("tabla_nominal") != tabla_nominal: return None
+    if max_edad is not None and time.time() - snap["cargado_en"] > max_edad: return None
+    return snap["datos"], snap["cargado_en"], snap["indices"]
@@ -0,0 +1,93 @@
+import pandas as pd
+from datetime import datetime
+import pytz
+import unicodedata
+import re
+
+# ======================================================
+# ZONA HORARIA, CONFIGURACIONES Y HELPERS
+# ======================================================
+TZ_AR = pytz.timezone('America/Argentina/Buenos_Aires')
+
+def get_now_ar_str(): return datetime.now(TZ_AR).strftime("%Y-%m-%d %H:%M:%S")
+def get_today_ar(): return datetime.now(TZ_AR).date()
+
+def calculate_age(born):
+    try:
+        born = pd.to_datetime(born).date()
+        today = get_today_ar()
+        return today.year - born.year - ((today.month, today.day) < (born.month, born.day))
+    except: return 0
+
+def format_wa_number(phone):
+    return re.sub(r'\D', '', str(phone))
+
+def clean_string(s):
+    if not isinstance(s, str): return ""
+    s = ''.join(c for c in unicodedata.normalize('NFD', s) if unicodedata.category(c) != 'Mn')
+    return s.strip().upper()
+
+def clean_int(x, default=0):
+    try: return int(float(str(x).strip()))
+    except: return default
+
+C_BELEN = "Calle Belén"
+C_NUDO = "Nudo a Nudo"
+C_MARANATHA = "Casa Maranatha"
+CENTROS = [C_BELEN, C_NUDO, C_MARANATHA]
+# Roles que ven y cargan toda la federación; el resto de los usuarios trabaja sobre su centro.
+ROLES_GLOBALES = ["Administración", "coordinacion"]
+
+def centro_canonico(centro):
+    """Nombre de CENTROS que corresponde a `centro` sin importar tildes ni mayúsculas, o None."""
+    centro_clean = clean_string(centro)
+    return next((c for c in CENTROS if clean_string(c) == centro_clean), None)
+
+# ✅ CONFIGURACIÓN DEL CALENDARIO SEMANAL DE RELEVAMIENTO (IMAGE_816E1F)
+CALENDARIO_MARANATHA = {
+    0: ["Taller Costura CFP", "Apoyo sec.", "Plan FinEs", "General"], # Lunes
+    1: ["Taller de Arte", "La Ronda", "Plan FinEs", "General"],      # Martes
+    2: ["Taller Costura CFP", "Apoyo sec.", "General"],              # Miércoles
+    3: ["Apoyo Esc. Primario", "Almuerzo", "Fútbol Calle Belén", "Espacio Joven", "General"], # Jueves
+    4: ["Pre-Juvenil", "Plan FinEs", "General"],                    # Viernes
+    5: ["General"],                                                 # Sábado
+    6: ["General"]                                                  # Domingo
+}
+
+DEFAULT_ESPACIO = "General"
+
+# Actividades que se espera ver cargadas cada día de la semana, por centro.
+# Los centros sin calendario propio cargan una única planilla "General" por día.
+CALENDARIO_CENTROS = {
+    C_BELEN: {d: [DEFAULT_ESPACIO] for d in range(7)},
+    C_NUDO: {d: [DEFAULT_ESPACIO] for d in range(7)},
+    C_MARANATHA: CALENDARIO_MARANATHA,
+}
+CATEGORIAS_SEGUIMIENTO = ["Escucha / Acompañamiento", "Salud", "Trámite (DNI/Social)", "Educación", "Familiar", "Crisis / Conflicto", "Otro"]
+
+def year_of(fecha_iso: str) -> str:
+    try: return str(pd.to_datetime(fecha_iso).year)
+    except: return str(get_today_ar().year)
+
+def latest_asistencia(df):
+    if df.empty: return df
+    df2 = df.copy()
+    df2["timestamp_dt"] = pd.to_datetime(df2["created_at"], errors="coerce", format="ISO8601")
+    df2["k"] = (df2["anio"].astype(str)+"|"+df2["fecha"].astype(str)+"|"+df2["centro"].astype(str)+"|"+df2["espacio"].astype(str))
+    return df2.sort_values("timestamp_dt").groupby("k", as_index=False).tail(1)
+
+def get_today_asistencia_summary(df_a):
+    if df_a.empty: return df_a.copy()
+    hoy = get_today_ar().isoformat()
+    d = df_a[df_a["fecha"] == hoy].copy()
+    if d.empty: return d.copy()
+    d["timestamp_dt"] = pd.to_datetime(df_a["created_at"], errors="coerce", format="ISO8601") if "created_at" in df_a.columns else pd.to_datetime(d["created_at"], errors="coerce", format="ISO8601")
+    return d.sort_values("timestamp_dt").groupby(["centro", "espacio"]).tail(1)
+
+def filter_personas_centro(df_personas, centro):
+    if df_personas.empty: return df_personas
+    if centro in ROLES_GLOBALES: return df_personas.copy()
+    centro_clean = clean_string(centro)
+    df_temp = df_personas.copy()
+    df_temp['centro_norm'] = df_temp['centro'].apply(clean_string)
+    return df_temp[df_temp['centro_norm'] == centro_clean].copy()
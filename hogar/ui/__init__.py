@@ -0,0 +1,5 @@
+"""Capa Streamlit de la app: estilos, login, sesión y una página por pestaña.
+
+Solo la importa `app.py`. `login` y `estilos` no traen pandas ni supabase; el resto se
+importa recién con la sesión iniciada, y cada página cuando se abre su pestaña.
+"""
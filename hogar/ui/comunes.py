@@ -0,0 +1,40 @@
+import streamlit as st
+
+from .sesion import get_data_store
+
+# ======================================================
+# ENCABEZADO Y AVISO DE FRESCURA DE LOS DATOS
+# ======================================================
+def show_top_header(nombre, centro):
+    col_inf, col_out = st.columns([3, 1])
+    with col_inf:
+        st.markdown(f"""
+        <div style='display:flex; align-items:center; gap:12px; background-color: var(--surface); padding: 10px 15px; border-radius: var(--radius-lg); border: 1px solid rgba(255,255,255,0.05);'>
+            <div style='background-color: var(--primary); width: 38px; height: 35px; border-radius: 50%; display:flex; align-items:center; justify-content:center; color:black; font-weight:bold; font-size:1rem;'>
+                {nombre[0].upper() if nombre else 'U'}
+            </div>
+            <div>
+                <div class='user-info'>{nombre}</div>
+                <div class='center-info'>Centro: {centro}</div>
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
+    with col_out:
+        st.markdown("<div class='logout-wrapper'>", unsafe_allow_html=True)
+        if st.button("Salir"):
+            st.session_state.clear()
+            st.rerun()
+        st.markdown("</div>", unsafe_allow_html=True)
+    st.markdown("<div style='margin-bottom:15px;'></div>", unsafe_allow_html=True)
+
+def show_data_freshness_banner():
+    store = get_data_store()
+    edad = store.edad_segundos()
+    if edad is None: return
+    hace = f"{int(edad)} s" if edad < 60 else f"{int(edad // 60)} min"
+    if store.ultimo_error and edad > 2 * store.intervalo:
+        st.markdown(f"<div class='alert-box alert-warning'>La base no responde: mostrando datos de hace {hace}. Los cambios nuevos pueden no verse todavía.</div>", unsafe_allow_html=True)
+    col_t, col_b = st.columns([3, 1])
+    col_t.caption(f"Datos actualizados hace {hace}")
+    if col_b.button("Actualizar", key="btn_refrescar_datos"):
+        store.pedir_refresco()
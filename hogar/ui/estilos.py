@@ -0,0 +1,28 @@
+import os
+import streamlit as st
+
+from ..config import RAIZ
+
+# ======================================================
+# CONFIGURACIÓN DE TEMA OSCURO PREMIUM Y MOBILE
+# ======================================================
+# La hoja de estilos vive en static/estilos.css. Con `server.enableStaticServing` (ver
+# .streamlit/config.toml) el navegador la baja una sola vez y la cachea: en cada rerun solo
+# viaja el <link>. Si el servido estático está apagado se manda en línea, como antes.
+CSS_PATH = os.path.join(RAIZ, "static", "estilos.css")
+
+@st.cache_resource
+def _css_en_linea():
+    with open(CSS_PATH, encoding="utf-8") as f:
+        return f"<style>{f.read()}</style>"
+
+@st.cache_resource
+def _link_css():
+    # La fecha de modificación en la URL invalida la caché del navegador cuando cambia el archivo.
+    return f"<link rel='stylesheet' href='app/static/estilos.css?v={int(os.path.getmtime(CSS_PATH))}'>"
+
+def aplicar_estilos():
+    if st.get_option("server.enableStaticServing"):
+        st.markdown(_link_css(), unsafe_allow_html=True)
+    else:
+        st.markdown(_css_en_linea(), unsafe_allow_html=True)
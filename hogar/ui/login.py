@@ -0,0 +1,60 @@
+import streamlit as st
+
+# ======================================================
+# PANTALLA DE INGRESO
+# ======================================================
+# Solo importa streamlit: el cliente de Supabase (y con él pandas) se carga recién al enviar
+# el formulario, así la pantalla de ingreso se dibuja sin esperar esas importaciones.
+def show_login_screen():
+    st.markdown("<br>", unsafe_allow_html=True)
+    try: st.image("logo_hogar.png", width=160)
+    except: pass
+    
+    st.markdown("### HOGAR DE CRISTO BAHIA BLANCA")
+    st.markdown("<p style='color:var(--text-secondary); font-size:0.9rem; margin-top:-10px; margin-bottom:25px;'>Ingresá tus credenciales para gestionar el centro.</p>", unsafe_allow_html=True)
+    
+    with st.form("login_form_oficial"):
+        u = st.text_input("Usuario", placeholder="Ej: guillermina").strip()
+        p = st.text_input("Contraseña", type="password", placeholder="••••••••").strip()
+        
+        st.markdown("<br>", unsafe_allow_html=True)
+        if st.form_submit_button("Ingresar al Sistema", use_container_width=True):
+            if not u or not p:
+                st.error("Completá ambos campos.")
+            else:
+                with st.spinner("Autenticando..."):
+                    try:
+                        from .sesion import get_supabase_client
+                        supabase = get_supabase_client()
+                        query = supabase.leer(lambda: supabase.table("usuarios").select("*"))
+                        if query.data:
+                            user_data = None
+                            for row in query.data:
+                                db_user = row.get("usuarios") or row.get("usuario")
+                                if db_user and str(db_user).strip().lower() == u.lower():
+                                    user_data = row
+                                    break
+                            
+                            if user_data:
+                                if str(user_data["password_text"]) == p:
+                                    st.session_state.update({
+                                        "logged_in": True, 
+                                        "usuario": u, 
+                                        "centro_asignado": user_data["centro"].strip(), 
+                                        "nombre_visible": user_data["nombre_visible"]
+                                    })
+                                    st.rerun()
+                                else: st.error("Contraseña incorrecta.")
+                            else: st.error("El usuario ingresado no existe.")
+                        else: st.error("Error crítico: No hay usuarios registrados.")
+                    except Exception as e: st.error(f"Error de conexión: {e}")
+                    
+    st.markdown("""
+    <div style='text-align: center; margin-top: 60px; font-size: 0.85rem; color: #444;'>
+        Hogar de Cristo Bahía Blanca <br>
+        <a href='mailto:alejandrodelfuma@gmail.com' style='color: #60A5FA; text-decoration: none; font-weight: 600;'>
+            Soporte Técnico
+        </a>
+    </div>
+    """, unsafe_allow_html=True)
+    st.stop()
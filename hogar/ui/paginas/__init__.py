@@ -0,0 +1 @@
+"""Un módulo por pestaña; `app.py` los importa de a uno cuando se abren."""
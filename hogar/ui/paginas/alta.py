@@ -0,0 +1,66 @@
+import streamlit as st
+import pandas as pd
+
+from ...helpers import CENTROS, ROLES_GLOBALES
+from ..sesion import cliente_sesion, refrescar_tras_guardar
+
+# ======================================================
+# PESTAÑA: ALTA DE PERSONA
+# ======================================================
+def page_alta_persona(df_personas, centro, usuario):
+    supabase = cliente_sesion()
+    st.markdown("<h3 style='margin-bottom:15px;'>Alta de Persona al Padrón</h3>", unsafe_allow_html=True)
+    st.info("Completá este formulario para ingresar al sistema a alguien que ya participa del centro.")
+    
+    if centro in ROLES_GLOBALES:
+        centro_destino = st.selectbox("Asignar legajo al centro:", CENTROS, key="alta_admin_select")
+    else:
+        centro_destino = centro
+
+    with st.form("alta_directa_form"):
+        st.markdown("#### Datos Principales")
+        col_a1, col_a2 = st.columns(2)
+        with col_a1:
+            new_nom = st.text_input("Nombre Completo *", placeholder="Ej: Juan Pérez")
+            new_dni = st.text_input("DNI")
+            new_nac = st.text_input("Fecha de Nacimiento (AAAA-MM-DD)", help="Ej: 1998-11-08")
+        with col_a2:
+            new_tel = st.text_input("Teléfono")
+            new_em = st.text_input("Contacto de Emergencia")
+            new_dom = st.text_input("Dirección / Barrio")
+        
+        st.markdown("#### Información Adicional")
+        new_etq = st.text_input("Etiquetas (Separadas por coma)")
+        new_notas = st.text_area("Notas Permanentes")
+        
+        if st.form_submit_button("Guardar en el Padrón (Supabase)", type="primary", use_container_width=True):
+            if not new_nom.strip():
+                st.error("El Nombre Completo es obligatorio.")
+            else:
+                with st.spinner("Guardando legajo en la nube..."):
+                    try:
+                        check = supabase.leer(lambda: supabase.table("personas").select("*").eq("centro", centro_destino).ilike("nombre", new_nom.strip()))
+                        if check.data:
+                            st.warning(f"'{new_nom}' ya existe en este centro.")
+                        else:
+                            fecha_nac_valida = None
+                            if new_nac.strip():
+                                try: 
+                                    fecha_nac_valida = pd.to_datetime(new_nac.strip()).date().isoformat()
+                                except:
+                                    st.error("Formato de fecha incorrecto. Usar AAAA-MM-DD.")
+                                    st.stop()
+
+                            fila_nueva = {
+                                "nombre": new_nom.strip(), "dni": new_dni.strip() if new_dni.strip() else None,
+                                "fecha_nacimiento": fecha_nac_valida, "telefono": new_tel.strip() if new_tel.strip() else None,
+                                "domicilio": new_dom.strip() if new_dom.strip() else None, "contacto_emergencia": new_em.strip() if new_em.strip() else None,
+                                "etiquetas": new_etq.strip() if new_etq.strip() else None, "notas": new_notas.strip() if new_notas.strip() else None,
+                                "activo": "SI", "centro": centro_destino, "usuario_alta": usuario
+                            }
+                            supabase.table("personas").insert(fila_nueva).execute()
+                            st.balloons()
+                            st.success(f"¡{new_nom} ingresado correctamente!")
+                            refrescar_tras_guardar(centro=centro_destino)
+                            st.rerun()
+                    except Exception as e: st.error(f"Error al guardar: {e}")
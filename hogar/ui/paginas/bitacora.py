@@ -0,0 +1,78 @@
+import re
+import html
+import time
+import streamlit as st
+
+from ...helpers import clean_string, get_today_ar, CENTROS, ROLES_GLOBALES, CATEGORIAS_SEGUIMIENTO
+from ...busqueda import terminos, LARGO_MINIMO_PREFIJO
+from ..sesion import get_indice
+
+POR_PAGINA = 20
+
+# ======================================================
+# PESTAÑA: BÚSQUEDA EN LA BITÁCORA
+# ======================================================
+def resaltar(texto, consulta):
+    """Escapa `texto` y marca las palabras que coinciden con algún término de la consulta."""
+    buscados = terminos(consulta)
+    def coincide(palabra):
+        p = clean_string(palabra)
+        return any(p == t or (len(t) >= LARGO_MINIMO_PREFIJO and p.startswith(t)) for t in buscados)
+    partes = re.split(r"(\w+)", str(texto))
+    return "".join(f"<mark>{html.escape(p)}</mark>" if buscados and coincide(p) else html.escape(p) for p in partes)
+
+def page_buscar_bitacora(df_seg, centro):
+    st.markdown("<h3 style='margin-bottom:15px;'>Buscar en la Bitácora</h3>", unsafe_allow_html=True)
+    indice = get_indice("busqueda_bitacora")
+
+    if df_seg.empty or indice is None or indice.n_docs == 0:
+        st.markdown("<div class='alert-box alert-gray'>Todavía no hay notas asentadas en la bitácora.</div>", unsafe_allow_html=True)
+        return
+
+    consulta = st.text_input("Buscar en las notas:", placeholder="Ej: turno hospital, DNI, escuela...", key="bitacora_consulta")
+    c1, c2, c3 = st.columns(3)
+    with c1:
+        if centro in ROLES_GLOBALES:
+            centro_sel = st.selectbox("Centro:", ["Todos"] + CENTROS, key="bitacora_centro")
+        else:
+            centro_sel = centro
+            st.text_input("Centro:", value=centro, disabled=True)
+    with c2: categoria = st.selectbox("Categoría:", ["Todas"] + CATEGORIAS_SEGUIMIENTO, key="bitacora_categoria")
+    with c3: autor = st.selectbox("Registrada por:", ["Todos"] + indice.autores_distintos(), key="bitacora_autor")
+
+    rango = st.date_input("Entre fechas (opcional):", value=(), max_value=get_today_ar(), key="bitacora_fechas")
+    desde = rango[0] if len(rango) > 0 else None
+    hasta = rango[1] if len(rango) > 1 else desde
+
+    t0 = time.perf_counter()
+    docs, puntajes = indice.buscar(
+        consulta,
+        centro=None if centro_sel == "Todos" else centro_sel,
+        categoria=None if categoria == "Todas" else categoria,
+        autor=None if autor == "Todos" else autor,
+        desde=desde, hasta=hasta,
+    )
+    ms = (time.perf_counter() - t0) * 1000
+
+    if len(docs) == 0:
+        st.markdown("<div class='alert-box alert-gray'>No hay notas que coincidan con la búsqueda.</div>", unsafe_allow_html=True)
+        return
+
+    paginas = (len(docs) - 1) // POR_PAGINA + 1
+    if st.session_state.get("bitacora_pagina", 1) > paginas: st.session_state["bitacora_pagina"] = 1
+    pagina = st.number_input(f"Página (de {paginas}):", min_value=1, max_value=paginas, step=1, key="bitacora_pagina") if paginas > 1 else 1
+    st.caption(f"{len(docs)} notas encontradas en {ms:.1f} ms — mostrando {(pagina - 1) * POR_PAGINA + 1} a {min(pagina * POR_PAGINA, len(docs))}")
+
+    filas = df_seg.iloc[docs[(pagina - 1) * POR_PAGINA: pagina * POR_PAGINA]]
+    for _, row in filas.iterrows():
+        st.markdown(f"""
+        <div class='note-card'>
+            <div style='display:flex; justify-content:space-between; font-size:0.75rem; color:var(--text-secondary); margin-bottom:5px;'>
+                <span>Fecha: <b>{html.escape(str(row.get('fecha', '')))}</b> — {html.escape(str(row.get('nombre_persona', '')))} — Categoria: <i>{html.escape(str(row.get('categoria', '')))}</i></span>
+                <span>{html.escape(str(row.get('centro', '')))} · Por: {html.escape(str(row.get('usuario_registro', '')))}</span>
+            </div>
+            <div style='font-size:0.95rem; color:var(--text-primary); line-height:1.4;'>
+                {resaltar(row.get('observacion', ''), consulta)}
+            </div>
+        </div>
+        """, unsafe_allow_html=True)
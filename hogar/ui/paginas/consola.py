@@ -0,0 +1,82 @@
+import streamlit as st
+from datetime import timedelta
+
+from ...helpers import get_today_ar, clean_int, C_BELEN, C_NUDO, C_MARANATHA
+from ...datos import backfill_persona_ids, migrar_a_formato_compacto
+from ...analisis import cobertura_actividades, matriz_cobertura, resumen_cobertura_diaria, cumplimiento_por_coordinador, tabla_auditoria
+from ..sesion import cliente_sesion, refrescar_tras_guardar
+
+# ======================================================
+# CONSOLE GLOBAL ADMIN (SUPERVISIÓN TOTAL DE COORDINADORES)
+# ======================================================
+def page_global(df_asistencia, df_personas, df_ap):
+    supabase = cliente_sesion()
+    st.markdown("<h3 style='margin-bottom:15px;'>Consola Central Institucional</h3>", unsafe_allow_html=True)
+    st.caption("Panel de control unificado para de cargas generales de Hogar de Cristo Bahía Blanca.")
+    
+    t_pers = df_personas["id"].nunique() if not df_personas.empty else 0
+    t_asist = df_asistencia["presentes"].apply(lambda x: clean_int(x, 0)).sum() if not df_asistencia.empty else 0
+    
+    k1, k2 = st.columns(2)
+    k1.markdown(f"<div class='kpi'><h3>Padrón Total Institucional</h3><div class='v'>{t_pers}</div><span style='font-size:0.75rem; color:var(--text-secondary);'>Personas en la federación</span></div>", unsafe_allow_html=True)
+    k2.markdown(f"<div class='kpi'><h3>Total de Asistencias</h3><div class='v'>{t_asist}</div><span style='font-size:0.75rem; color:var(--text-secondary);'>Ingresos totales acumulados</span></div>", unsafe_allow_html=True)
+    
+    st.markdown("<br>#### Semáforo de Actividad de Hoy", unsafe_allow_html=True)
+    
+    hoy = get_today_ar()
+    resumen_hoy = resumen_cobertura_diaria(cobertura_actividades(df_asistencia, hoy, hoy)).set_index("centro")
+    
+    for col, c in zip(st.columns(3), [C_BELEN, C_MARANATHA, C_NUDO]):
+        with col:
+            esperadas = int(resumen_hoy.at[c, "esperadas"]) if c in resumen_hoy.index else 0
+            cargadas = int(resumen_hoy.at[c, "cargadas"]) if c in resumen_hoy.index else 0
+            if cargadas == 0: st.markdown(f"<div class='alert-box alert-danger'>{c}: Falta Cargar</div>", unsafe_allow_html=True)
+            elif cargadas < esperadas: st.markdown(f"<div class='alert-box alert-warning'>{c}: Parcial {cargadas}/{esperadas}</div>", unsafe_allow_html=True)
+            else: st.markdown(f"<div class='alert-box alert-success'>{c}: Al Día</div>", unsafe_allow_html=True)
+
+    st.markdown("<br>#### Cobertura Histórica de Actividades", unsafe_allow_html=True)
+    rango = st.date_input("Período a auditar", value=(hoy - timedelta(days=29), hoy), max_value=hoy, key="cobertura_rango")
+    if isinstance(rango, (tuple, list)) and len(rango) == 2:
+        cob = cobertura_actividades(df_asistencia, rango[0], rango[1])
+        total = len(cob)
+        cargadas = int(cob["cargado"].sum()) if total else 0
+        st.caption(f"{cargadas} de {total} actividades esperadas cargadas ({(100 * cargadas / total if total else 0):.1f}%).")
+        vista = st.radio("Ver:", ["Faltantes por día", "Matriz completa", "Por coordinador"], horizontal=True, key="cobertura_vista")
+        if vista == "Faltantes por día":
+            faltan = cob[~cob["cargado"]].sort_values(["fecha", "centro"], ascending=[False, True])
+            st.dataframe(faltan[["fecha", "centro", "espacio"]].rename(columns={"fecha": "Fecha", "centro": "Centro Barrial", "espacio": "Actividad"}), use_container_width=True, hide_index=True)
+        elif vista == "Matriz completa":
+            st.dataframe(matriz_cobertura(cob).replace({True: "✓", False: "✗"}), use_container_width=True)
+        else:
+            st.dataframe(cumplimiento_por_coordinador(cob).rename(columns={"coordinador": "Responsable", "esperadas": "Esperadas", "cargadas": "Cargadas", "cumplimiento_pct": "Cumplimiento %"}), use_container_width=True, hide_index=True)
+
+    st.markdown("<br>#### Auditoría y Registro de Planillas", unsafe_allow_html=True)
+    if not df_asistencia.empty:
+        df_audit_clean = tabla_auditoria(df_asistencia)
+        st.dataframe(df_audit_clean, use_container_width=True, hide_index=True)
+        
+        st.markdown("<br>", unsafe_allow_html=True)
+        csv_historico = df_audit_clean.to_csv(index=False).encode('utf-8')
+        st.download_button("📥 Descargar Base de Datos Histórica Completa", data=csv_historico, file_name="historico_asistencias_federacion.csv", mime="text/csv")
+    else:
+        st.markdown("<div class='alert-box alert-gray'>No se registran planillas en la base de datos de asistencia.</div>", unsafe_allow_html=True)
+
+    st.markdown("<br>#### Mantenimiento", unsafe_allow_html=True)
+    with st.expander("Migrar asistencia nominal al formato compacto"):
+        st.caption("Copia asistencia_personas a planillas_asistencia (una fila por planilla) y padrones. No borra nada y se puede repetir. Después de migrar, poner formato_asistencia = \"compacto\" en secrets.toml.")
+        if st.button("Migrar ahora", key="btn_migrar_compacto"):
+            with st.spinner("Migrando planillas..."):
+                try:
+                    n = migrar_a_formato_compacto(supabase)
+                    st.success(f"{n} planillas migradas.")
+                except Exception as e: st.error(f"Error al migrar: {e}")
+    with st.expander("Completar persona_id en asistencia y bitácora"):
+        st.caption("Resuelve los nombres guardados contra el padrón (sin tildes, mayúsculas ni orden de palabras) y guarda el id. También revisa datapersonas.csv. Solo toca filas sin persona_id.")
+        if st.button("Completar ids", key="btn_backfill_ids"):
+            with st.spinner("Resolviendo nombres..."):
+                try:
+                    for origen, (resueltos, sin_resolver) in backfill_persona_ids(supabase).items():
+                        st.write(f"**{origen}**: {resueltos} resueltos, {len(sin_resolver)} sin legajo")
+                        if sin_resolver: st.caption(", ".join(sin_resolver[:50]) + (" ..." if len(sin_resolver) > 50 else ""))
+                    refrescar_tras_guardar(completo=True)
+                except Exception as e: st.error(f"Error al completar ids: {e}")
@@ -0,0 +1,54 @@
+import streamlit as st
+
+from ...helpers import get_today_ar, filter_personas_centro, clean_string, CENTROS, ROLES_GLOBALES
+from ...analisis import tabla_contactos, SIN_CONTACTO_DIAS
+from ..sesion import get_indice
+
+# Opción -> (columna, ascendente). Quien nunca tuvo contacto va siempre primero.
+ORDENES = {
+    "Más días sin contacto": ("dias_sin_contacto", False),
+    "Última asistencia más vieja": ("ultima_asistencia", True),
+    "Última intervención más vieja": ("ultima_intervencion", True),
+    "Nombre": ("nombre", True),
+}
+COLUMNAS_VISTA = {
+    "nombre": "Nombre", "dias_sin_contacto": "Días sin contacto", "ultimo_contacto": "Último contacto",
+    "ultima_asistencia": "Última asistencia", "ultima_intervencion": "Última intervención", "intervenciones": "Intervenciones",
+}
+
+# ======================================================
+# PESTAÑA: PERSONAS SIN CONTACTO
+# ======================================================
+def page_sin_contacto(df_personas, centro):
+    st.markdown("<h3 style='margin-bottom:15px;'>Personas sin Contacto</h3>", unsafe_allow_html=True)
+
+    centro_seleccionado = st.selectbox("Filtrar por centro barrial:", CENTROS, key="contacto_centro") if centro in ROLES_GLOBALES else centro
+    df_centro = filter_personas_centro(df_personas, centro_seleccionado)
+    resumen = get_indice("contactos")
+
+    if df_centro.empty or resumen is None:
+        st.markdown("<div class='alert-box alert-gray'>Todavía no hay personas cargadas en este centro.</div>", unsafe_allow_html=True)
+        return
+
+    c1, c2, c3 = st.columns(3)
+    with c1: minimo = st.number_input("Sin contacto hace al menos (días):", min_value=0, value=SIN_CONTACTO_DIAS, step=7, key="contacto_dias")
+    with c2: orden = st.selectbox("Ordenar por:", list(ORDENES), key="contacto_orden")
+    with c3: filtro_activo = st.radio("Estado:", ["Solo Activos", "Todos"], horizontal=True, key="contacto_activos")
+
+    tabla = tabla_contactos(df_centro, resumen, get_today_ar())
+    if filtro_activo == "Solo Activos":
+        tabla = tabla[tabla["activo"].astype(str).str.upper() == "SI"]
+    sin_contacto = tabla[tabla["dias_sin_contacto"].isna() | (tabla["dias_sin_contacto"] >= minimo)]
+    columna, ascendente = ORDENES[orden]
+    sin_contacto = sin_contacto.sort_values(columna, ascending=ascendente, na_position="first" if columna != "nombre" else "last")
+
+    nunca = int(sin_contacto["dias_sin_contacto"].isna().sum())
+    st.markdown(f"<div class='alert-box alert-gray'><b>{len(sin_contacto)}</b> de {len(tabla)} personas sin contacto hace {minimo} días o más ({nunca} sin ninguna asistencia ni nota registrada).</div>", unsafe_allow_html=True)
+    if sin_contacto.empty: return
+
+    categorias = [c for c in tabla.columns[list(tabla.columns).index("intervenciones") + 1:] if sin_contacto[c].any()]
+    st.dataframe(sin_contacto[list(COLUMNAS_VISTA) + categorias].rename(columns=COLUMNAS_VISTA), use_container_width=True, hide_index=True)
+
+    st.markdown("<br>", unsafe_allow_html=True)
+    csv = sin_contacto.drop(columns="activo").to_csv(index=False).encode("utf-8")
+    st.download_button("📥 Exportar listado a Excel/CSV", data=csv, file_name=f"sin_contacto_{clean_string(centro_seleccionado).lower().replace(' ', '_')}.csv", mime="text/csv")
@@ -0,0 +1,213 @@
+import streamlit as st
+import pandas as pd
+from datetime import timedelta
+
+from ...helpers import (
+    get_today_ar, year_of, get_today_asistencia_summary, filter_personas_centro,
+    C_MARANATHA, CENTROS, ROLES_GLOBALES, CALENDARIO_MARANATHA, DEFAULT_ESPACIO,
+)
+from ...datos import nombres_por_id, guardar_planilla_compacta
+from ...analisis import RETENCION_EN_RIESGO, frecuencias_padron, cobertura_actividades, cumpleanos, ausencias_consecutivas
+from ..sesion import cliente_sesion, formato_compacto, tabla_nominal, get_indice, refrescar_tras_guardar
+
+# ======================================================
+# PESTAÑA: INICIO (NOVEDADES, KPIs Y SEMÁFORO DEL DÍA)
+# ======================================================
+# ✅ SEMÁFORO DINÁMICO GEOMÉTRICO (SIN TEXTO CRUDO HTML) BASADO EN CALENDARIO DIARIO
+def show_workshop_monitor(df_asistencia, centro_seleccionado, fecha_seleccionada):
+    if centro_seleccionado not in [C_MARANATHA]:
+        return
+        
+    st.markdown("<h4 style='font-size:0.9rem; margin-bottom:10px; color:var(--text-secondary); text-transform:uppercase;'>Control de Actividades para este Día</h4>", unsafe_allow_html=True)
+    
+    cob = cobertura_actividades(df_asistencia, fecha_seleccionada, fecha_seleccionada, [centro_seleccionado])
+    
+    html_monitor = "<div class='workshop-status-container'>"
+    for act, cargado in zip(cob["espacio"], cob["cargado"]):
+        if cargado:
+            html_monitor += "<div class='workshop-row'><span class='workshop-name'>• " + str(act) + "</span><span class='workshop-badge badge-done'>Cargado</span></div>"
+        else:
+            html_monitor += "<div class='workshop-row'><span class='workshop-name'>• " + str(act) + "</span><span class='workshop-badge badge-pending'>Falta Cargar</span></div>"
+    html_monitor += "</div>"
+    st.markdown(html_monitor, unsafe_allow_html=True)
+
+def show_top_alerts(df_latest, df_personas, df_ap, centro):
+    if centro in ROLES_GLOBALES:
+        return
+        
+    df_c = filter_personas_centro(df_personas, centro)
+    df_c_act = df_c[df_c["activo"].astype(str).str.upper() == "SI"] if not df_c.empty else pd.DataFrame()
+    
+    cumples = []
+    alertas_inasistencia = []
+    today = get_today_ar()
+    
+    if not df_c_act.empty:
+        cumples = cumpleanos(df_c_act, today)
+        criticos = ausencias_consecutivas(df_ap, centro)
+        alertas_inasistencia = df_c_act.loc[df_c_act["id"].isin(criticos), "nombre"].unique().tolist()
+
+    st.markdown("<h4 style='font-size:1rem; margin-bottom:10px;'>Novedades del Centro</h4>", unsafe_allow_html=True)
+    today_a = get_today_asistencia_summary(df_latest)
+    c_a = today_a[today_a["centro"] == centro] if not today_a.empty else pd.DataFrame()
+
+    ac1, ac2, ac3 = st.columns(3)
+    with ac1:
+        if c_a.empty: st.markdown("<div class='alert-box alert-danger'>Faltan Asistencias</div>", unsafe_allow_html=True)
+        else: st.markdown("<div class='alert-box alert-success'>Asistencias al día</div>", unsafe_allow_html=True)
+    with ac2:
+        if cumples:
+            with st.expander(f"Cumpleaños ({len(cumples)})", expanded=True):
+                for c in cumples: st.write(f"- {c}")
+        else: st.markdown("<div class='alert-box alert-gray'>Sin cumples</div>", unsafe_allow_html=True)
+    with ac3:
+        if alertas_inasistencia:
+            with st.expander(f"Alerta: Ausencias ({len(alertas_inasistencia)})", expanded=True):
+                for a in alertas_inasistencia: st.write(f"- {a}")
+        else: st.markdown("<div class='alert-box alert-gray'>Sin alertas críticas</div>", unsafe_allow_html=True)
+
+    if not df_c_act.empty:
+        frec = frecuencias_padron(df_c_act, get_indice("frecuencias"), today)
+        en_riesgo = frec[frec["retencion"] == "En riesgo"].sort_values("ultima_asistencia")
+        if not en_riesgo.empty:
+            with st.expander(f"Dejaron de venir hace más de {RETENCION_EN_RIESGO} días ({len(en_riesgo)})"):
+                for _, r in en_riesgo.iterrows(): st.write(f"- {r['nombre']} (última vez: {r['ultima_asistencia']})")
+
+def kpi_row_full(df_asistencia, centro):
+    hoy_date = get_today_ar()
+    
+    c1 = c2 = c3 = 0
+    serie = get_indice("serie_diaria")
+    if serie is not None:
+        centro_kpi = None if centro in ROLES_GLOBALES else centro
+        c1 = serie.total(hoy_date, hoy_date, centro_kpi)
+        c2 = serie.total(hoy_date - timedelta(days=6), hoy_date, centro_kpi)
+        c3 = serie.total(hoy_date.replace(day=1), hoy_date, centro_kpi)
+        
+    kc1, kc2, kc3 = st.columns(3)
+    kc1.markdown(f"<div class='kpi'><h3>Ingresos HOY</h3><div class='v'>{c1}</div></div>", unsafe_allow_html=True)
+    kc2.markdown(f"<div class='kpi'><h3>Ultimos 7 dias</h3><div class='v'>{c2}</div></div>", unsafe_allow_html=True)
+    kc3.markdown(f"<div class='kpi'><h3>Mes actual</h3><div class='v'>{c3}</div></div>", unsafe_allow_html=True)
+
+# ======================================================
+# PESTAÑA: CARGA DIARIA CON FILTRO POR TALLER INTERACTIVO
+# ======================================================
+MODOS = ["Día habitual", "Actividad especial", "Cerrado"]
+
+# Las pestañas se dibujan solo abiertas y Streamlit descarta el estado de los widgets que no se
+# dibujaron: la planilla a medio cargar se copia a `carga` en cada cambio y vuelve como valor
+# inicial al reabrir Inicio.
+def _cargado(campo, por_defecto):
+    return st.session_state.get("carga", {}).get(campo, por_defecto)
+
+def _anotar(campo):
+    st.session_state.setdefault("carga", {})[campo] = st.session_state[f"carga_{campo}"]
+
+def _persistente(campo):
+    return {"key": f"carga_{campo}", "on_change": _anotar, "args": (campo,)}
+
+def _indice(opciones, campo):
+    valor = _cargado(campo, None)
+    return opciones.index(valor) if valor in opciones else 0
+
+def page_registrar_asistencia(df_personas, df_asistencia, df_ap, centro, nombre_visible, usuario):
+    supabase = cliente_sesion()
+    st.markdown("<h3 style='margin-bottom:15px;'>Carga Diaria</h3>", unsafe_allow_html=True)
+    
+    if centro in ROLES_GLOBALES:
+        centro_seleccionado = st.selectbox("Seleccionar Centro a gestionar:", CENTROS, index=_indice(CENTROS, "centro"), **_persistente("centro"))
+    else:
+        centro_seleccionado = centro
+
+    fecha = st.date_input("Fecha de carga", value=_cargado("fecha", get_today_ar()), **_persistente("fecha"))
+    if fecha > get_today_ar():
+        st.error("No se puede cargar asistencia de días futuros.")
+        return
+    fecha_str = fecha.isoformat()
+    
+    # Renderizar el monitor de estado específico del día
+    show_workshop_monitor(df_asistencia, centro_seleccionado, fecha)
+    
+    # ✅ ASIGNACIÓN DINÁMICA DE ESPACIOS POR TALLER
+    if centro_seleccionado == C_MARANATHA:
+        dia_semana_idx = fecha.weekday()
+        opciones_espacio = CALENDARIO_MARANATHA.get(dia_semana_idx, ["General"])
+        col_e, col_m = st.columns(2)
+        with col_e: espacio = st.selectbox("Actividad / Taller del Día", opciones_espacio, index=_indice(opciones_espacio, "espacio"), **_persistente("espacio"))
+        with col_m: modo = st.selectbox("Modo / Actividad", MODOS, index=_indice(MODOS, "modo"), **_persistente("modo"))
+    else:
+        espacio = DEFAULT_ESPACIO
+        col_m = st.columns(1)[0]
+        with col_m: modo = st.selectbox("Modo / Actividad", MODOS, index=_indice(MODOS, "modo"), **_persistente("modo"))
+
+    notas = st.text_area("Notas generales del día (Opcional)", value=_cargado("notas", ""), height=70, **_persistente("notas"))
+
+    df_centro = filter_personas_centro(df_personas, centro_seleccionado)
+    df_activos = df_centro[df_centro["activo"].astype(str).str.upper() == "SI"] if not df_centro.empty else pd.DataFrame()
+    ids_activos = df_activos.sort_values("nombre")["id"].tolist() if not df_activos.empty else []
+    nombre_de = nombres_por_id(df_activos)
+    
+    st.markdown("#### Marcar Asistencia")
+    presentes = st.multiselect("Buscador de personas", options=ids_activos, format_func=lambda i: nombre_de.get(i, str(i)), placeholder="Seleccionar asistentes...",
+                               default=[i for i in _cargado("presentes", []) if i in nombre_de], **_persistente("presentes"))
+    total_presentes = len(presentes)
+    
+    st.markdown("<br>", unsafe_allow_html=True)
+    forrar_reemplazo = st.checkbox("Corregir datos: tildar aca para reemplazar la planilla anterior.", value=_cargado("corregir", False), **_persistente("corregir"))
+    
+    if st.button("GUARDAR ASISTENCIA (SUPABASE)", type="primary", use_container_width=True):
+        if total_presentes <= 0 and modo != "Cerrado":
+            st.error("Debes marcar asistentes o indicar 'Cerrado'.")
+            return
+            
+        with st.spinner("Procesando en Supabase..."):
+            try:
+                if forrar_reemplazo:
+                    supabase.table("asistencia_diaria").delete().eq("fecha", fecha_str).eq("centro", centro_seleccionado).eq("espacio", espacio).execute()
+                    supabase.table(tabla_nominal()).delete().eq("fecha", fecha_str).eq("centro", centro_seleccionado).eq("espacio", espacio).execute()
+                
+                cabecera = {
+                    "fecha": fecha_str, "anio": year_of(fecha_str), "centro": centro_seleccionado,
+                    "espacio": espacio, "presentes": total_presentes, "coordinador": nombre_visible,
+                    "modo": modo, "notas": notas, 
+                    "usuario": usuario, "accion": "replaced" if forrar_reemplazo else "append"
+                }
+                supabase.table("asistencia_diaria").insert(cabecera).execute()
+                
+                if formato_compacto():
+                    guardar_planilla_compacta(supabase, df_ap, cabecera, presentes, ids_activos)
+                else:
+                    filas_personas = []
+                    for i in presentes:
+                        filas_personas.append({
+                            "fecha": fecha_str, "anio": year_of(fecha_str), "centro": centro_seleccionado,
+                            "espacio": espacio, "persona_id": int(i), "nombre": nombre_de[i], "estado": "Presente", "es_nuevo": "NO",
+                            "coordinador": nombre_visible, "usuario": usuario
+                        })
+                    ausentes = [i for i in ids_activos if i not in presentes]
+                    for i in ausentes:
+                        filas_personas.append({
+                            "fecha": fecha_str, "anio": year_of(fecha_str), "centro": centro_seleccionado,
+                            "espacio": espacio, "persona_id": int(i), "nombre": nombre_de[i], "estado": "Ausente", "es_nuevo": "NO",
+                            "coordinador": nombre_visible, "usuario": usuario
+                        })
+                
+                    if filas_personas:
+                        supabase.table("asistencia_personas").insert(filas_personas).execute()
+                
+                st.balloons()
+                st.toast("Cambios guardados correctamente")
+                refrescar_tras_guardar(completo=forrar_reemplazo, centro=centro_seleccionado)
+                st.rerun()
+                
+            except Exception as e:
+                err_str = str(e)
+                if "23505" in err_str or "already exists" in err_str.lower():
+                    st.markdown(f"""
+                    <div class='alert-box alert-warning'>
+                        <b>Planilla existente:</b> Ya se cargo una asistencia para el espacio '{espacio}' en esta fecha.<br><br>
+                        <b>¿Te equivocaste o queres corregirla?</b> Activa la casilla de arriba que dice "Corregir datos" y volve a presionar el botón de guardar.
+                    </div>
+                    """, unsafe_allow_html=True)
+                else:
+                    st.error(f"Error inesperado: {e}")
@@ -0,0 +1,146 @@
+import streamlit as st
+import pandas as pd
+
+from ...helpers import get_today_ar, calculate_age, format_wa_number, year_of, filter_personas_centro, CENTROS, ROLES_GLOBALES, CATEGORIAS_SEGUIMIENTO
+from ...datos import nombres_por_id, filas_de_persona
+from ...analisis import frecuencias_padron
+from ..sesion import cliente_sesion, get_indice, refrescar_tras_guardar
+
+# ======================================================
+# PESTAÑA: BUSCADOR DE LEGAJOS Y BITÁCORA
+# ======================================================
+def page_personas_full(df_personas, df_ap, df_seg, centro, usuario):
+    supabase = cliente_sesion()
+    st.markdown("<h3 style='margin-bottom:15px;'>Buscador de Legajos</h3>", unsafe_allow_html=True)
+    
+    if centro in ROLES_GLOBALES:
+        centro_seleccionado = st.selectbox("Filtrar padrón por centro barrial:", CENTROS, key="padrón_admin_select")
+    else:
+        centro_seleccionado = centro
+
+    df_centro = filter_personas_centro(df_personas, centro_seleccionado)
+    ids = df_centro.sort_values("nombre")["id"].tolist() if not df_centro.empty else []
+    nombre_de = nombres_por_id(df_centro)
+
+    seleccion_id = st.selectbox("Escribi el nombre para ver la ficha:", [None] + ids, format_func=lambda i: "" if i is None else nombre_de.get(i, str(i)))
+    
+    if seleccion_id is None:
+        st.markdown("<div class='alert-box alert-gray'>Busca a alguien arriba para ver su carnet.</div>", unsafe_allow_html=True)
+        if not df_centro.empty:
+            st.markdown("#### Padrón Oficial del Centro")
+            filtro_activo = st.radio("Filtrar padrón por estado:", ["Solo Activos", "Todos"], horizontal=True)
+            df_mostrar_padrón = df_centro.copy()
+            if filtro_activo == "Solo Activos":
+                df_mostrar_padrón = df_mostrar_padrón[df_mostrar_padrón["activo"].astype(str).str.upper() == "SI"]
+            frec = frecuencias_padron(df_mostrar_padrón, get_indice("frecuencias"), get_today_ar())[["persona_id", "frecuencia", "ultima_asistencia"]]
+            df_mostrar_padrón = df_mostrar_padrón.merge(frec, left_on="id", right_on="persona_id", how="left")
+                
+            st.dataframe(df_mostrar_padrón[["nombre", "dni", "telefono", "activo", "frecuencia", "ultima_asistencia"]].sort_values("nombre"), use_container_width=True, hide_index=True)
+            
+            st.markdown("<br>", unsafe_allow_html=True)
+            csv_padron = df_mostrar_padrón[["nombre", "dni", "telefono", "domicilio", "activo", "frecuencia", "ultima_asistencia"]].sort_values("nombre").to_csv(index=False).encode('utf-8')
+            st.download_button("📥 Exportar Padrón de este Centro a Excel/CSV", data=csv_padron, file_name=f"padron_{centro_seleccionado}.csv", mime="text/csv")
+        return
+
+    seleccion = nombre_de[seleccion_id]
+    datos_persona = df_centro[df_centro["id"] == seleccion_id].iloc[0]
+    
+    tags_str = str(datos_persona.get("etiquetas", ""))
+    telefono = str(datos_persona.get("telefono", ""))
+    wa_btn_html = f"<a href='https://wa.me/{format_wa_number(telefono)}' target='_blank' class='btn-wa'>Enviar WhatsApp</a>" if (telefono and telefono.lower() != "none") else ""
+    
+    is_active = str(datos_persona.get("activo")).upper() != "NO"
+    status_class = "status-active" if is_active else "status-inactive"
+    status_text = "• Activo" if is_active else "• Inactivo"
+    
+    dni_val = str(datos_persona.get('dni', '')).strip()
+    dni_val = "S/D" if (not dni_val or dni_val.lower() == 'none') else dni_val
+    
+    nac_val = str(datos_persona.get('fecha_nacimiento', '')).strip()
+    nacimiento_mostrar = "S/D" if (not nac_val or nac_val.lower() == 'none') else f"{nac_val} ({calculate_age(nac_val)} anos)"
+    
+    direccion_val = str(datos_persona.get('domicilio','')).strip()
+    direccion_mostrar = "No registrada" if (not direccion_val or direccion_val.lower() == 'none') else direccion_val
+
+    st.markdown(f"""
+    <div class="profile-card">
+        <div class="profile-header">
+            <div>
+                <span class="profile-institution">Hogar de Cristo Bahía Blanca</span>
+                <div class="profile-name">{seleccion}</div>
+            </div>
+            <span class="profile-status {status_class}">{status_text}</span>
+        </div>
+        <div class="profile-grid">
+            <div class="profile-meta-item">
+                <span class="profile-meta-label">Documento</span>
+                <span class="profile-meta-value">{dni_val}</span>
+            </div>
+            <div class="profile-meta-item">
+                <span class="profile-meta-label">Nacimiento / Edad</span>
+                <span class="profile-meta-value">{nacimiento_mostrar}</span>
+            </div>
+            <div class="profile-meta-item" style="grid-column: span 2;">
+                <span class="profile-meta-label">Direccion</span>
+                <span class="profile-meta-value">{direccion_mostrar}</span>
+            </div>
+        </div>
+    """, unsafe_allow_html=True)
+    
+    if tags_str and tags_str.lower() != "none" and tags_str.lower() != "nan":
+        st.markdown(f"""
+        <div class="profile-footer-data">
+            <span class="profile-meta-label" style="font-size:0.55rem; opacity:0.8;">Datos Familiares / Referencia</span>
+            <div style="font-size:0.85rem; font-weight:600; color:var(--text-primary); margin-top:2px;">{tags_str}</div>
+        </div>
+        """, unsafe_allow_html=True)
+    
+    st.markdown("</div>", unsafe_allow_html=True)
+    
+    if wa_btn_html:
+        st.markdown(wa_btn_html, unsafe_allow_html=True)
+        st.markdown("<br>", unsafe_allow_html=True)
+
+    st.markdown("### Registrar Intervención / Nota del Día")
+    with st.form("form_bitacora_seguimiento", clear_on_submit=True):
+        f_nota = st.date_input("Fecha de lo ocurrido", value=get_today_ar())
+        cat_nota = st.selectbox("Categoría de Seguimiento", CATEGORIAS_SEGUIMIENTO)
+        obs_nota = st.text_area("¿Qué pasó hoy?", placeholder="Ej: Se charló con el referente familiar...")
+        
+        if st.form_submit_button("Guardar en Bitácora (Supabase)", use_container_width=True):
+            if not obs_nota.strip():
+                st.error("La observación no puede quedar vacía.")
+            else:
+                with st.spinner("Asentando nota en la nube..."):
+                    try:
+                        f_nota_str = f_nota.isoformat()
+                        nueva_intervencion = {
+                            "fecha": f_nota_str, "anio": year_of(f_nota_str), "centro": centro_seleccionado,
+                            "persona_id": int(seleccion_id), "nombre_persona": seleccion, "categoria": cat_nota,
+                            "observacion": obs_nota.strip(), "usuario_registro": usuario
+                        }
+                        supabase.table("bitacora_seguimiento").insert(nueva_intervencion).execute()
+                        st.toast(f"Nota registrada para {seleccion}")
+                        refrescar_tras_guardar(centro=centro_seleccionado)
+                        st.rerun()
+                    except Exception as e: st.error(f"Error al registrar nota: {e}")
+
+    st.markdown("<br>### Historial de Acompañamiento", unsafe_allow_html=True)
+    df_chico = filas_de_persona(df_seg, seleccion_id).copy() if not df_seg.empty else pd.DataFrame()
+    
+    if df_chico.empty:
+        st.markdown("<div class='alert-box alert-gray'>Todavía no hay notas asentadas en la bitácora para este participante.</div>", unsafe_allow_html=True)
+    else:
+        df_chico = df_chico.sort_values("fecha", ascending=False)
+        for _, row in df_chico.iterrows():
+            st.markdown(f"""
+            <div class='note-card'>
+                <div style='display:flex; justify-content:space-between; font-size:0.75rem; color:var(--text-secondary); margin-bottom:5px;'>
+                    <span>Fecha: <b>{row['fecha']}</b> — Categoria: <i>{row['categoria']}</i></span>
+                    <span>Por: {row['usuario_registro']}</span>
+                </div>
+                <div style='font-size:0.95rem; color:var(--text-primary); line-height:1.4;'>
+                    {row['observacion']}
+                </div>
+            </div>
+            """, unsafe_allow_html=True)
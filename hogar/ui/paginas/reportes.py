@@ -0,0 +1,101 @@
+import streamlit as st
+import pandas as pd
+from datetime import date, timedelta
+
+from ...helpers import get_today_ar, CENTROS, ROLES_GLOBALES
+from ...analisis import clasificar_frecuencias
+from ..sesion import get_indice
+
+# ======================================================
+# PESTAÑA: REPORTES ANALÍTICOS AVANZADOS
+# ======================================================
+def page_reportes(df_asistencia, centro):
+    st.markdown("<h3 style='margin-bottom:15px;'>Métricas y Tendencias Temporales</h3>", unsafe_allow_html=True)
+    
+    centro_seleccionado = st.selectbox("Filtrar reporte por centro barrial:", CENTROS, key="reportes_admin_select") if centro in ROLES_GLOBALES else centro
+    df_c = df_asistencia[df_asistencia["centro"] == centro_seleccionado].copy() if not df_asistencia.empty else pd.DataFrame()
+    serie = get_indice("serie_diaria")
+    
+    if df_c.empty or serie is None:
+        st.markdown("<div class='alert-box alert-gray'>Todavía no hay datos históricos suficientes en este centro para generar estadísticas avanzadas.</div>", unsafe_allow_html=True)
+        return
+        
+    df_c["presentes_i"] = pd.to_numeric(df_c["presentes"], errors="coerce").fillna(0).astype(int)
+
+    hoy = get_today_ar()
+    
+    inicio_sem_actual = hoy - timedelta(days=6)
+    inicio_sem_anterior = hoy - timedelta(days=13)
+    inicio_mes_actual = hoy.replace(day=1)
+    inicio_mes_anterior = (inicio_mes_actual - timedelta(days=1)).replace(day=1)
+    
+    sum_sem_actual = serie.total(inicio_sem_actual, hoy, centro_seleccionado)
+    sum_sem_anterior = serie.total(inicio_sem_anterior, inicio_sem_actual - timedelta(days=1), centro_seleccionado)
+    sum_mes_actual = serie.total(inicio_mes_actual, hoy, centro_seleccionado)
+    sum_mes_anterior = serie.total(inicio_mes_anterior, inicio_mes_actual - timedelta(days=1), centro_seleccionado)
+    
+    def delta_pct(act, ant):
+        if ant == 0: return 0.0
+        return ((act - ant) / ant) * 100
+
+    wow_pct = delta_pct(sum_sem_actual, sum_sem_anterior)
+    mom_pct = delta_pct(sum_mes_actual, sum_mes_anterior)
+    
+    m1, m2 = st.columns(2)
+    with m1:
+        c_wow = "#86EFAC" if wow_pct >= 0 else "#FCA5A5"
+        st.markdown(f"""
+        <div class='kpi'>
+            <h3>Semana vs Semana Anterior (WoW)</h3>
+            <div class='v'>{sum_sem_actual} <span style='font-size:1rem; color:{c_wow}; font-weight:700;'>({"+" if wow_pct>=0 else ""}{wow_pct:.1f}%)</span></div>
+            <span style='font-size:0.7rem; color:var(--text-secondary);'>Últimos 7 días corridos vs período previo</span>
+        </div>
+        """, unsafe_allow_html=True)
+    with m2:
+        c_mom = "#86EFAC" if mom_pct >= 0 else "#FCA5A5"
+        st.markdown(f"""
+        <div class='kpi'>
+            <h3>Mes Actual vs Mes Anterior (MoM)</h3>
+            <div class='v'>{sum_mes_actual} <span style='font-size:1rem; color:{c_mom}; font-weight:700;'>({"+" if mom_pct>=0 else ""}{mom_pct:.1f}%)</span></div>
+            <span style='font-size:0.7rem; color:var(--text-secondary);'>Acumulado mensual vs mes cerrado anterior</span>
+        </div>
+        """, unsafe_allow_html=True)
+
+    st.markdown("<br>#### Período Personalizado", unsafe_allow_html=True)
+    primera = date.fromordinal(serie.inicio)
+    rango = st.date_input("Rango a analizar", value=(max(primera, hoy - timedelta(days=89)), hoy), min_value=primera, max_value=hoy, key="reportes_rango")
+    if isinstance(rango, (tuple, list)) and len(rango) == 2:
+        desde, hasta = rango
+        dias = (hasta - desde).days + 1
+        total_rango = serie.total(desde, hasta, centro_seleccionado)
+        total_previo = serie.total(desde - timedelta(days=dias), desde - timedelta(days=1), centro_seleccionado)
+        pct = delta_pct(total_rango, total_previo)
+        r1, r2 = st.columns(2)
+        r1.markdown(f"<div class='kpi'><h3>Ingresos del período</h3><div class='v'>{total_rango}</div><span style='font-size:0.7rem; color:var(--text-secondary);'>{dias} días · {total_rango / dias:.1f} por día</span></div>", unsafe_allow_html=True)
+        c_pct = "#86EFAC" if pct >= 0 else "#FCA5A5"
+        signo = "+" if pct >= 0 else ""
+        r2.markdown(f"<div class='kpi'><h3>Vs período anterior</h3><div class='v'>{total_previo} <span style='font-size:1rem; color:{c_pct}; font-weight:700;'>({signo}{pct:.1f}%)</span></div><span style='font-size:0.7rem; color:var(--text-secondary);'>Mismos {dias} días inmediatamente antes</span></div>", unsafe_allow_html=True)
+
+        st.markdown("<br>#### Evolución Lineal de Concurrencia", unsafe_allow_html=True)
+        df_linea = serie.serie(desde, hasta, centro_seleccionado, ventanas=(7, 28))
+        st.line_chart(df_linea.rename(columns={"ingresos": "Ingresos", "media_7d": "Media 7 días", "media_28d": "Media 28 días"}), color=["#60A5FA", "#A78BFA", "#86EFAC"])
+
+    st.markdown("<br>#### Análisis del Flujo por Día de la Semana", unsafe_allow_html=True)
+    df_c["dia_nombre"] = pd.to_datetime(df_c["fecha"]).dt.day_name()
+    map_dias = {'Monday':'Lunes','Tuesday':'Martes','Wednesday':'Miércoles','Thursday':'Jueves','Friday':'Viernes','Saturday':'Sábado','Sunday':'Domingo'}
+    df_c["dia_nombre"] = df_c["dia_nombre"].map(map_dias)
+    
+    df_dias_agg = df_c.groupby("dia_nombre")["presentes_i"].mean().reindex(['Lunes','Martes','Miércoles','Jueves','Viernes','Sábado','Domingo']).fillna(0)
+    st.bar_chart(df_dias_agg, color="#A78BFA")
+
+    st.markdown("<br>#### Frecuencia y Retención de Participantes", unsafe_allow_html=True)
+    frec = clasificar_frecuencias(get_indice("frecuencias"), hoy)
+    frec = frec[frec["centro"] == centro_seleccionado]
+    if frec.empty:
+        st.markdown("<div class='alert-box alert-gray'>Todavía no hay asistencias nominales para clasificar.</div>", unsafe_allow_html=True)
+        return
+    st.bar_chart(frec["frecuencia"].value_counts().reindex(["Diaria", "Semanal", "Mensual", "No asiste"]).fillna(0), color="#60A5FA")
+    cohortes = frec.pivot_table(index="cohorte", columns="retencion", values="persona_id", aggfunc="count", fill_value=0)
+    cohortes = cohortes.reindex(columns=["Nuevo", "Activo", "En riesgo", "Perdido"], fill_value=0).sort_index(ascending=False)
+    st.caption("Personas por mes de primera asistencia y estado actual.")
+    st.dataframe(cohortes, use_container_width=True)
@@ -0,0 +1,114 @@
+import streamlit as st
+import pandas as pd
+
+from .. import config
+from ..helpers import ROLES_GLOBALES, centro_canonico
+from ..conexion import SupabaseResiliente, ClienteCentro, crear_cliente
+from ..datos import SnapshotDatos, tablas_datos, fetch_all_data_supabase, fetch_novedades_supabase, leer_snapshot, filtrar_centro
+from ..analisis import INDICES_DERIVADOS
+
+
+# ======================================================
+# SESIÓN: CLIENTE DE SUPABASE
+# ======================================================
+# El cliente, la lectura de tablas y los cálculos viven en el resto del paquete (sin
+# Streamlit), que comparten la app y la línea de comandos. Acá solo se cablean a la sesión.
+# Este módulo trae pandas y supabase: se importa recién después del login.
+def supabase_setting(clave):
+    try: seccion = st.secrets["supabase"]
+    except: seccion = {}
+    return config.setting(seccion, clave)
+
+@st.cache_resource
+def get_supabase_client() -> SupabaseResiliente:
+    return crear_cliente(st.secrets["supabase"])
+
+def centro_de_datos():
+    """Centro al que se limitan las consultas de esta sesión; None para quien ve toda la federación."""
+    centro = st.session_state.get("centro_asignado")
+    if centro in ROLES_GLOBALES or str(st.session_state.get("usuario", "")).lower() == "admin": return None
+    return centro_canonico(centro)
+
+def cliente_sesion():
+    """Cliente para las escrituras de la sesión: un coordinador solo puede tocar filas de su centro."""
+    centro = centro_de_datos()
+    return get_supabase_client() if centro is None else ClienteCentro(get_supabase_client(), centro)
+
+# ======================================================
+# SESIÓN: ALMACÉN DE DATOS
+# ======================================================
+# Los formatos de asistencia nominal ("filas" y "compacto") se describen en `hogar.datos`.
+def formato_compacto():
+    return supabase_setting("formato_asistencia") == "compacto"
+
+def tabla_nominal():
+    return "planillas_asistencia" if formato_compacto() else "asistencia_personas"
+
+# Todos los almacenes del proceso, por (tabla_nominal, centro): un borrado en un centro tiene
+# que llegar también al almacén de la federación, y el feed de novedades solo ve inserciones.
+_ALMACENES = {}
+
+@st.cache_resource
+def _crear_data_store(tabla_nominal, centro) -> SnapshotDatos:
+    # Con centro, cada consulta (carga completa, novedades y padrones) sale con eq("centro", ...).
+    client = get_supabase_client() if centro is None else ClienteCentro(get_supabase_client(), centro)
+    tablas = tablas_datos(tabla_nominal)
+    store = SnapshotDatos(
+        lambda: fetch_all_data_supabase(client, tablas),
+        novedades=lambda datos: fetch_novedades_supabase(client, datos, tablas),
+        intervalo=supabase_setting("refresco"), recarga_completa=supabase_setting("recarga_completa"),
+        indices=INDICES_DERIVADOS,
+    )
+    # Arranque en caliente con el snapshot de `python -m hogar precompute`, si está vigente.
+    snap = leer_snapshot(config.ruta_local(supabase_setting("snapshot")), tabla_nominal, supabase_setting("snapshot_max_edad"))
+    if snap is not None:
+        datos, cargado_en, indices = snap
+        if centro is None: store.sembrar(datos, cargado_en, indices)
+        else: store.sembrar(filtrar_centro(datos, centro), cargado_en)
+    store.iniciar()
+    _ALMACENES[(tabla_nominal, centro)] = store
+    return store
+
+def get_data_store() -> SnapshotDatos:
+    # Un almacén por formato de asistencia y por centro: cambiar el formato en secrets.toml no
+    # mezcla datos, y las sesiones de un coordinador comparten solo el almacén de su centro.
+    return _crear_data_store(tabla_nominal(), centro_de_datos())
+
+def load_all_data_supabase():
+    store = get_data_store()
+    if store.actual() is None:
+        # Solo la primera sesión del proceso (o del centro) espera la carga inicial.
+        with st.spinner("Sincronizando..."):
+            try: store.asegurar_cargado()
+            except Exception as e:
+                st.error(f"Error crítico al leer datos: {e}")
+                return pd.DataFrame(), pd.DataFrame(), pd.DataFrame(), pd.DataFrame()
+    snap = store.actual()
+    st.session_state["version_datos"] = snap[2]
+    st.session_state["indices_datos"] = snap[3]
+    return snap[0]
+
+def get_indice(nombre):
+    """Índice derivado publicado junto con los datos que está mostrando esta sesión."""
+    return st.session_state.get("indices_datos", {}).get(nombre)
+
+def refrescar_tras_guardar(completo=False, timeout=1.0, centro=None):
+    """Pide una actualización en segundo plano y le da hasta `timeout` segundos para publicarse antes del rerun.
+
+    `completo=True` fuerza una recarga entera, necesaria cuando se borraron filas. El pedido
+    llega a todos los almacenes del proceso que incluyen `centro` (todos si es None), no solo
+    al de esta sesión; solo se espera al propio.
+    """
+    store = get_data_store()
+    version = store.version()
+    for (tabla, centro_store), otro in list(_ALMACENES.items()):
+        if otro is not store and tabla == tabla_nominal() and (centro is None or centro_store in (None, centro)):
+            otro.pedir_refresco(completo=completo)
+    store.pedir_refresco(completo=completo)
+    store.esperar_version(version, timeout)
+
+@st.fragment(run_every=supabase_setting("refresco"))
+def vigilar_cambios():
+    """Suscribe la sesión al almacén: si otra sesión guardó algo, vuelve a dibujar la app."""
+    if get_data_store().version() > st.session_state.get("version_datos", 0):
+        st.rerun(scope="app")